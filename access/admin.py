@@ -1,3 +1,51 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from common.admin import PerformanceModelAdmin
+from .forms import UserChangeForm, UserCreationForm
+from .models import User
 
-# Register your models here.
+
+@admin.register(User)
+class UserAdmin(PerformanceModelAdmin, BaseUserAdmin):
+    form = UserChangeForm
+    add_form = UserCreationForm
+    fieldsets = [
+        (None, {"fields": ["email", "password"]}),
+        ("Profile", {"fields": ["name", "user_type"]}),
+        ("Permissions", {"fields": ["is_active", "is_admin"]}),
+        (
+            "Metadata",
+            {"fields": ["id", "uuid", "last_login", "created_at", "updated_at"]},
+        ),
+    ]
+    add_fieldsets = [
+        (
+            None,
+            {
+                "classes": ["wide"],
+                "fields": [
+                    "email",
+                    "name",
+                    "user_type",
+                    "is_admin",
+                    "usable_password",
+                    "password1",
+                    "password2",
+                ],
+            },
+        ),
+    ]
+    # Prefix searches; see migration 0004_user_search_indexes.
+    search_fields = ["^email", "^name"]
+    readonly_fields = ["id", "uuid", "created_at", "updated_at", "last_login"]
+    list_display = [
+        "email",
+        "name",
+        "user_type",
+        "is_active",
+        "is_admin",
+        "created_at",
+    ]
+    list_filter = ["user_type", "is_active", "is_admin"]
+    ordering = ["-pk"]
+    filter_horizontal = []
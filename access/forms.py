@@ -0,0 +1,15 @@
+from django.contrib.auth import forms as auth_forms
+
+from .models import User
+
+
+class UserCreationForm(auth_forms.AdminUserCreationForm):
+    class Meta:
+        model = User
+        fields = ["email", "name", "user_type", "is_admin"]
+
+
+class UserChangeForm(auth_forms.UserChangeForm):
+    class Meta:
+        model = User
+        fields = "__all__"
@@ -0,0 +1,15 @@
+from django.core.mail import send_mail
+
+from jobs.registry import job
+from .models import User
+
+
+@job
+def send_welcome_email(user_id):
+    user = User.objects.get(pk=user_id)
+    send_mail(
+        "Welcome to BoxSpot",
+        f"Hi {user.name or user.email}, your account is ready.",
+        None,
+        [user.email],
+    )
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# Admin "^" searches filter on UPPER(column::text) LIKE 'TERM%', which only
+# an expression index with text_pattern_ops can serve on PostgreSQL.
+INDEXES = {
+    "auth_user_email_prefix_idx": "email",
+    "auth_user_name_prefix_idx": "name",
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON auth_user ((UPPER({column}::text)) text_pattern_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('access', '0003_user_access_user_uuid_covering'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
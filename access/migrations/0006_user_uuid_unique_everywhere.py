@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:57
+
+import common.models
+from django.db import migrations
+
+
+def user_uuid_uniq():
+    return common.models.CoveringUniqueConstraint(
+        fields=('uuid',), include=('id',), name='access_user_uuid_uniq'
+    )
+
+
+def add_plain_unique(apps, schema_editor):
+    # PostgreSQL already has the covering index (0005); elsewhere the
+    # constraint with include was skipped, leaving uuid unchecked.
+    if schema_editor.connection.features.supports_covering_indexes:
+        return
+    schema_editor.add_constraint(apps.get_model('access', 'User'), user_uuid_uniq())
+
+
+def remove_plain_unique(apps, schema_editor):
+    if schema_editor.connection.features.supports_covering_indexes:
+        return
+    schema_editor.remove_constraint(apps.get_model('access', 'User'), user_uuid_uniq())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('access', '0005_uuid_unique_covering'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name='user',
+                    name='access_user_uuid_uniq',
+                ),
+                migrations.AddConstraint(
+                    model_name='user',
+                    constraint=user_uuid_uniq(),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_plain_unique, remove_plain_unique),
+            ],
+        ),
+    ]
@@ -1,8 +1,22 @@
 # models.py
+import time
+import uuid
+
+from django.conf import settings
 from django.db import models, transaction
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
-from common.models import AbstractModel
+from common.models import AbstractModel, CoveringUniqueConstraint
+from common.metrics import record_cache, registry
+
+
+PROFILE_RELATIONS = ("company_profile", "person_profile")
+
+# Cache alias for profiles; only used when configured (see settings).
+PROFILE_CACHE = "profiles"
+
+_MISSING = object()
 
 
 class UserManager(BaseUserManager):
@@ -35,6 +49,10 @@ class UserManager(BaseUserManager):
 
         return self._create_user(email, password, **extra_fields)
 
+    def with_profile(self):
+        """Load users together with their company or person profile."""
+        return self.select_related(*PROFILE_RELATIONS)
+
 
 class User(AbstractBaseUser, AbstractModel):
     """Custom user model with email as username field."""
@@ -74,16 +92,27 @@ class User(AbstractBaseUser, AbstractModel):
         help_text="Designates whether the user can log into the admin site.",
     )
 
+    # Unique through the constraint in Meta.
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
+
     # Django auth requirements
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
     objects = UserManager()
 
+    validate_on_save = True
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         db_table = "auth_user"
+        constraints = [
+            # Covers id, so UUID to id resolution is an index-only scan.
+            CoveringUniqueConstraint(
+                fields=["uuid"], include=["id"], name="access_user_uuid_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.email}"
@@ -95,9 +124,14 @@ class User(AbstractBaseUser, AbstractModel):
         if not self.is_admin and not self.user_type:
             raise ValidationError("User type is required for non-admin users")
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
+    def check_password(self, raw_password):
+        start = time.perf_counter()
+        try:
+            return super().check_password(raw_password)
+        finally:
+            registry.observe(
+                "auth_password_check_duration_seconds", time.perf_counter() - start
+            )
 
     # Permission methods (required by Django)
     @property
@@ -124,11 +158,62 @@ class User(AbstractBaseUser, AbstractModel):
         return self.user_type == self.UserType.PERSON
 
     def get_profile(self):
+        """Return the company or person profile without repeating queries.
+
+        The result is memoized on the instance. Profiles loaded through
+        ``User.objects.with_profile()`` are used as is; otherwise the
+        per-user entry in the ``profiles`` cache, if one is configured, is
+        tried before querying. Entries are invalidated whenever a profile is
+        saved or deleted.
+        """
+        if "_profile" in self.__dict__:
+            return self._profile
+
         if self.is_company:
-            return getattr(self, "company_profile", None)
+            relation = "company_profile"
         elif self.is_person:
-            return getattr(self, "person_profile", None)
+            relation = "person_profile"
+        else:
+            relation = None
+
+        if relation is None:
+            profile = None
+        elif self._state.fields_cache.get(relation, _MISSING) is not _MISSING:
+            profile = self._state.fields_cache[relation]
+        else:
+            cache = profile_cache()
+            key = self.profile_cache_key(self.pk)
+            profile = _MISSING
+            if cache is not None:
+                profile = cache.get(key, _MISSING)
+                record_cache("profile", profile is not _MISSING)
+
+            if profile is _MISSING:
+                # Queried directly so the cached profile doesn't carry this user.
+                profile_model = self._meta.get_field(relation).related_model
+                profile = profile_model.objects.filter(user_id=self.pk).first()
+                if cache is not None:
+                    cache.set(key, profile)
+
+        self._profile = profile
+        return profile
+
+    @staticmethod
+    def profile_cache_key(user_id):
+        return f"access:profile:{user_id}"
+
+
+def profile_cache():
+    """Return the cache shared by all workers for profiles, or ``None``.
+
+    Saving a profile invalidates its entry only in the cache the saving
+    process talks to, so a per-process backend would serve stale profiles
+    from other workers. Profiles are therefore only cached across requests
+    when ``PROFILE_CACHE_URL`` configures a shared backend.
+    """
+    if PROFILE_CACHE not in settings.CACHES:
         return None
+    return caches[PROFILE_CACHE]
 
 
 # # services.py - Business logic separated from models
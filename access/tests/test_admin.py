@@ -0,0 +1,51 @@
+from django.urls import reverse
+
+from access.models import User
+from common.testing.cases import TestCase
+from common.testing.factories import UserFactory
+
+
+class UserAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserFactory.create(is_admin=True)
+        cls.user = UserFactory.create(email="jane@example.com", name="Jane")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.admin)
+
+    def test_add_user_sets_password(self):
+        url = reverse("admin:access_user_add")
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        response = self.client.post(
+            url,
+            {
+                "email": "new@example.com",
+                "name": "New",
+                "user_type": User.UserType.PERSON,
+                "usable_password": "true",
+                "password1": "correct-horse-battery",
+                "password2": "correct-horse-battery",
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(email="new@example.com")
+        self.assertTrue(user.check_password("correct-horse-battery"))
+
+    def test_change_and_password_pages(self):
+        for name, args in [
+            ("admin:access_user_change", [self.user.pk]),
+            ("admin:auth_user_password_change", [self.user.pk]),
+        ]:
+            response = self.client.get(reverse(name, args=args))
+            self.assertEqual(response.status_code, 200, name)
+
+    def test_prefix_search(self):
+        response = self.client.get(
+            reverse("admin:access_user_changelist"), {"q": "jan"}
+        )
+        self.assertEqual(list(response.context["cl"].result_list), [self.user])
+
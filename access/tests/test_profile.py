@@ -0,0 +1,41 @@
+from django.test import override_settings
+
+from access.models import User
+from common.testing.cases import TestCase
+from common.testing.factories import CompanyFactory
+
+
+class GetProfileTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CompanyFactory.create()
+
+    def fresh_user(self):
+        return User.objects.get(pk=self.company.user_id)
+
+    def test_cached_across_instances(self):
+        self.assertEqual(self.fresh_user().get_profile(), self.company)
+
+        user = self.fresh_user()
+        with self.assertNumQueries(0):
+            self.assertEqual(user.get_profile(), self.company)
+
+    def test_saving_profile_invalidates(self):
+        self.fresh_user().get_profile()
+
+        self.company.name = "Renamed"
+        self.company.save()
+
+        self.assertEqual(self.fresh_user().get_profile().name, "Renamed")
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_not_cached_without_profile_cache(self):
+        self.fresh_user().get_profile()
+
+        user = self.fresh_user()
+        with self.assertNumQueries(1):
+            user.get_profile()
+        with self.assertNumQueries(0):
+            user.get_profile()
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework.authentication import BaseAuthentication
+
+
+class JWTAuthentication(BaseAuthentication):
+    """JWT authentication that loads the user together with their profile.
+
+    DRF resolves its default authentication classes while the URLconf is
+    imported, and simplejwt's settings module pulls in ``django.test``. The
+    simplejwt-based implementation in ``api.auth.backends`` is therefore
+    only imported once a request actually carries a token.
+    """
+
+    def authenticate(self, request):
+        header_name = getattr(settings, "SIMPLE_JWT", {}).get(
+            "AUTH_HEADER_NAME", "HTTP_AUTHORIZATION"
+        )
+        if header_name not in request.META:
+            return None
+
+        return self.backend.authenticate(request)
+
+    def authenticate_header(self, request):
+        return self.backend.authenticate_header(request)
+
+    def get_validated_token(self, raw_token):
+        return self.backend.get_validated_token(raw_token)
+
+    def get_user(self, validated_token):
+        return self.backend.get_user(validated_token)
+
+    @cached_property
+    def backend(self):
+        from api.auth.backends import ProfileJWTAuthentication
+
+        return ProfileJWTAuthentication()
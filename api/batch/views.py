@@ -0,0 +1,136 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve, reverse
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .serializers import BatchSerializer
+
+
+logger = logging.getLogger(__name__)
+
+# Request metadata that describes the batch body rather than the sub-request.
+BODY_META = ("CONTENT_LENGTH", "CONTENT_TYPE", "wsgi.input")
+
+
+class BatchView(APIView):
+    """Run several GET requests against the API routes in one round trip.
+
+    The batch request is authenticated once and every sub-request runs as
+    the same user, skipping its own authentication. Each result carries its
+    own status code, so one failing sub-request does not fail the batch.
+    Routes answering with files or other non-API responses get a 400 entry.
+
+    With ``"parallel": true`` the sub-requests run on a thread pool when
+    served over ASGI. Under WSGI they always run one after another, since
+    worker capacity there is sized for one thread per request.
+    """
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        paths = [item["path"] for item in serializer.validated_data["requests"]]
+        parallel = (
+            serializer.validated_data["parallel"]
+            and len(paths) > 1
+            and isinstance(request._request, ASGIRequest)
+        )
+
+        if parallel:
+            workers = min(settings.BATCH_MAX_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Copied context so sub-requests share this request's identity map.
+                futures = [
+                    executor.submit(
+                        copy_context().run, self._run_in_thread, request, path
+                    )
+                    for path in paths
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [self.run(request, path) for path in paths]
+
+        return Response({"responses": results})
+
+    def run(self, request, path):
+        parts = urlsplit(path)
+        api_root = reverse("batch").removesuffix("batch/")
+
+        try:
+            if not parts.path.startswith(api_root):
+                raise Resolver404
+            match = resolve(parts.path)
+        except Resolver404:
+            return {"path": path, "status": 404, "body": {"detail": "Not found."}}
+
+        if getattr(match.func, "view_class", None) is BatchView:
+            return {
+                "path": path,
+                "status": 400,
+                "body": {"detail": "Batch requests cannot be nested."},
+            }
+
+        try:
+            response = match.func(
+                self._subrequest(request, parts, match), *match.args, **match.kwargs
+            )
+        except Exception:
+            logger.exception("Batch sub-request to %s failed", path)
+            return {"path": path, "status": 500, "body": None}
+
+        try:
+            if not hasattr(response, "data"):
+                # Files and other non-API responses have no body to embed.
+                return {
+                    "path": path,
+                    "status": 400,
+                    "body": {"detail": "Not available in batch requests."},
+                }
+
+            return {"path": path, "status": response.status_code, "body": response.data}
+        finally:
+            self._release(response)
+
+    def _release(self, response):
+        # What response.close() does, minus the request_finished signal: that
+        # would close this request's database connections midway.
+        for closer in response._resource_closers:
+            closer()
+        response._resource_closers.clear()
+        response.closed = True
+
+    def _run_in_thread(self, request, path):
+        try:
+            return self.run(request, path)
+        finally:
+            connections.close_all()
+
+    def _subrequest(self, request, parts, match):
+        subrequest = HttpRequest()
+        subrequest.method = "GET"
+        subrequest.path = subrequest.path_info = parts.path
+        subrequest.GET = QueryDict(parts.query)
+        subrequest.COOKIES = request.COOKIES
+        subrequest.META = {
+            key: value for key, value in request.META.items() if key not in BODY_META
+        }
+        subrequest.META.update(
+            REQUEST_METHOD="GET", PATH_INFO=parts.path, QUERY_STRING=parts.query
+        )
+        subrequest.resolver_match = match
+
+        # Picked up by DRF in place of the sub-request's own authentication.
+        # Anonymous sub-requests authenticate themselves, so permission
+        # failures keep their 401 and WWW-Authenticate header.
+        if request.user.is_authenticated:
+            subrequest._force_auth_user = request.user
+            subrequest._force_auth_token = request.auth
+
+        return subrequest
@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.utils import encoders
+
+from .exceptions import BadRequest, Conflict
+from .models import IdempotencyKey
+
+
+HEADER = "Idempotency-Key"
+
+
+class IdempotentCreateMixin:
+    """Replay the stored response when a create is retried with the same key.
+
+    The lookup, the create itself and the stored response share one
+    transaction, guarded by a Postgres advisory lock on the key, so concurrent
+    duplicates wait for the first request and then replay its response.
+    """
+
+    def create(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return super().create(request, *args, **kwargs)
+
+        if len(key) > IdempotencyKey._meta.get_field("key").max_length:
+            raise BadRequest({"detail": f"{HEADER} is too long", "code": "invalid_key"})
+
+        fingerprint = _fingerprint(request)
+
+        with transaction.atomic():
+            _lock(request.user.pk, key)
+
+            record = IdempotencyKey.objects.filter(
+                user=request.user, key=key, expires_at__gt=timezone.now()
+            ).first()
+
+            if record:
+                if record.fingerprint != fingerprint:
+                    raise Conflict(
+                        {
+                            "detail": f"{HEADER} was already used for another request",
+                            "code": "idempotency_key_reused",
+                        }
+                    )
+
+                return Response(
+                    record.response_body,
+                    status=record.response_status,
+                    headers={"Idempotent-Replayed": "true"},
+                )
+
+            response = super().create(request, *args, **kwargs)
+
+            IdempotencyKey.objects.update_or_create(
+                user=request.user,
+                key=key,
+                defaults={
+                    "fingerprint": fingerprint,
+                    "response_status": response.status_code,
+                    "response_body": json.loads(
+                        json.dumps(response.data, cls=encoders.JSONEncoder)
+                    ),
+                    "expires_at": timezone.now() + settings.IDEMPOTENCY_KEY_TTL,
+                },
+            )
+
+        return response
+
+
+def _fingerprint(request):
+    payload = json.dumps(
+        [request.method, request.path, request.data], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _lock(user_id, key):
+    if connection.vendor != "postgresql":
+        return
+
+    digest = hashlib.sha256(f"{user_id}:{key}".encode()).digest()
+    lock_id = int.from_bytes(digest[:8], "big", signed=True)
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
@@ -0,0 +1,63 @@
+import io
+import timeit
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework import parsers, renderers
+
+from api.parsers import JSONParser
+from api.product.serializers import ProductSerializer
+from api.renderers import JSONRenderer
+from content.models import Product
+
+
+class Command(BaseCommand):
+    help = "Compare the orjson renderer/parser with DRF's stdlib implementation."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        products = [
+            Product(
+                id=index,
+                name=f"Product {index}",
+                description="Corrugated box, double wall. " * 20,
+                category=Product.CategoryType.BOX,
+                price=Decimal("12.50") + index,
+            )
+            for index in range(options["products"])
+        ]
+        data = ProductSerializer(products, many=True).data
+
+        stdlib_renderer = renderers.JSONRenderer()
+        fast_renderer = JSONRenderer()
+
+        expected = stdlib_renderer.render(data)
+        if fast_renderer.render(data) != expected:
+            self.stderr.write(self.style.ERROR("Rendered output differs"))
+            return
+
+        self._report(
+            "render",
+            lambda: stdlib_renderer.render(data),
+            lambda: fast_renderer.render(data),
+            options["repeat"],
+        )
+        self._report(
+            "parse",
+            lambda: parsers.JSONParser().parse(io.BytesIO(expected)),
+            lambda: JSONParser().parse(io.BytesIO(expected)),
+            options["repeat"],
+        )
+
+    def _report(self, name, baseline, candidate, repeat):
+        baseline_time = timeit.timeit(baseline, number=repeat) / repeat
+        candidate_time = timeit.timeit(candidate, number=repeat) / repeat
+
+        self.stdout.write(
+            f"{name}: stdlib {baseline_time * 1000:.2f}ms, "
+            f"orjson {candidate_time * 1000:.2f}ms "
+            f"({baseline_time / candidate_time:.1f}x)"
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from api.product import catalog
+
+
+class Command(BaseCommand):
+    help = "Build the precompressed catalog export if the catalog has changed."
+
+    def handle(self, *args, **options):
+        version = catalog.catalog_version()
+        catalog.ensure_snapshot(version)
+        self.stdout.write(f"Catalog snapshot {version} is up to date")
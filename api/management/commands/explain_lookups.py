@@ -0,0 +1,39 @@
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from access.models import User
+from content.models import Order, Product
+
+
+class Command(BaseCommand):
+    help = "Print query plans for the UUID lookups used by the API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run the queries and report actual timings (PostgreSQL only).",
+        )
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options = {"analyze": True, "buffers": True}
+
+        for model in (Product, Order, User):
+            sample = (
+                model.objects.order_by().values_list("uuid", flat=True).first()
+                or uuid.uuid4()
+            )
+            lookups = {
+                "uuid -> id": model.objects.filter(uuid=sample).values_list("id"),
+                "uuid -> row": model.objects.filter(uuid=sample),
+            }
+
+            for name, queryset in lookups.items():
+                heading = f"{model.__name__} {name}"
+                self.stdout.write(self.style.MIGRATE_HEADING(heading))
+                self.stdout.write(queryset.order_by().explain(**explain_options))
+                self.stdout.write("")
@@ -0,0 +1,25 @@
+from django.db import models
+
+from common.models import AbstractModel
+
+
+class IdempotencyKey(AbstractModel):
+    """Stored outcome of a request made with an ``Idempotency-Key`` header."""
+
+    user = models.ForeignKey(
+        "access.User", on_delete=models.CASCADE, related_name="idempotency_keys"
+    )
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+
+    response_status = models.PositiveSmallIntegerField()
+    response_body = models.JSONField(null=True)
+
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="unique_idempotency_key_per_user"
+            )
+        ]
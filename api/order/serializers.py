@@ -1,10 +1,35 @@
+from django.core.exceptions import ValidationError
 from rest_framework import serializers
-from content.models import Order
+from api.exceptions import Conflict
+from common import identity
+from content.models import Order, OrderItem, Product
+from services.order import Service
+
+
+class ProductField(serializers.SlugRelatedField):
+    """Reference a product by UUID, resolved through the request identity map."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("slug_field", "uuid")
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return identity.get(self.get_queryset(), uuid=data)
+        except Product.DoesNotExist:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=data)
+        except (TypeError, ValueError, ValidationError):
+            self.fail("invalid")
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
+    product = ProductField(read_only=True)
     product_name = serializers.CharField(source="product.name", read_only=True)
 
+    class Meta:
+        model = OrderItem
+        fields = ["product", "product_name", "quantity", "unit_price"]
+
 
 class OrderSerializer(serializers.ModelSerializer):
     customer = serializers.SerializerMethodField()
@@ -12,10 +37,53 @@ class OrderSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Order
-        fields = "__all__"
+        # Integer ids stay internal; orders and customers are exposed by uuid.
+        fields = [
+            "uuid",
+            "customer",
+            "status",
+            "total_amount",
+            "items",
+            "created_at",
+            "updated_at",
+        ]
 
     def get_customer(self, obj):
         if obj.customer:
-            return {"id": obj.id, "name": getattr("obj.customer", "name", None)}
+            return {
+                "uuid": obj.customer.uuid,
+                "name": getattr(obj.customer, "name", None),
+            }
 
         return None
+
+
+class OrderItemCreateSerializer(serializers.Serializer):
+    product = ProductField(queryset=Product.objects.all())
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class OrderCreateSerializer(serializers.Serializer):
+    items = OrderItemCreateSerializer(many=True, allow_empty=False)
+
+    def validate_items(self, items):
+        products = [item["product"].pk for item in items]
+        if len(products) != len(set(products)):
+            raise serializers.ValidationError("Each product may appear only once.")
+
+        return items
+
+    def create(self, validated_data):
+        try:
+            return Service.create_order(
+                validated_data["customer"],
+                [
+                    (item["product"], item["quantity"])
+                    for item in validated_data["items"]
+                ],
+            )
+        except ValidationError as e:
+            raise Conflict({"detail": e.messages[0], "code": e.code})
+
+    def to_representation(self, instance):
+        return OrderSerializer(instance, context=self.context).data
@@ -0,0 +1,124 @@
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.models import ContentType
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from api.authentication import JWTAuthentication
+from common.pubsub import broker
+from content.models import Order
+
+
+class OrderStatusStream:
+    """ASGI app streaming the customer's order status changes as server-sent events.
+
+    Authenticates with a JWT access token from the ``Authorization`` header or
+    a ``token`` query parameter (``EventSource`` cannot set headers). Idle
+    connections hold only a queue in the process-wide broker and get a
+    comment line every ``heartbeat`` seconds to keep proxies from closing them.
+    """
+
+    heartbeat = 15
+
+    async def __call__(self, scope, receive, send):
+        topic = await sync_to_async(self.get_topic)(scope)
+        if topic is None:
+            await self.reject(send, 401, "Invalid or missing access token.")
+            return
+
+        queue = broker.subscribe(topic)
+        disconnect = asyncio.ensure_future(self.wait_for_disconnect(receive))
+        message = asyncio.ensure_future(queue.get())
+
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/event-stream"),
+                        (b"cache-control", b"no-cache"),
+                        (b"x-accel-buffering", b"no"),
+                    ],
+                }
+            )
+
+            while True:
+                done, _ = await asyncio.wait(
+                    {message, disconnect},
+                    timeout=self.heartbeat,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if disconnect in done:
+                    break
+
+                if message in done:
+                    data = json.dumps(message.result())
+                    body = f"event: order.status\ndata: {data}\n\n"
+                    message = asyncio.ensure_future(queue.get())
+                else:
+                    body = ": ping\n\n"
+
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": body.encode(),
+                        "more_body": True,
+                    }
+                )
+        finally:
+            broker.unsubscribe(topic, queue)
+            message.cancel()
+            disconnect.cancel()
+
+    def get_topic(self, scope):
+        headers = dict(scope["headers"])
+
+        authorization = headers.get(b"authorization", b"").split()
+        if len(authorization) == 2 and authorization[0].lower() == b"bearer":
+            raw_token = authorization[1]
+        else:
+            raw_token = parse_qs(scope.get("query_string", b"").decode()).get(
+                "token", [None]
+            )[0]
+
+        if not raw_token:
+            return None
+
+        authentication = JWTAuthentication()
+        try:
+            user = authentication.get_user(
+                authentication.get_validated_token(raw_token)
+            )
+        except (AuthenticationFailed, InvalidToken, TokenError):
+            return None
+
+        customer = user.get_profile()
+        if customer is None:
+            return None
+
+        return Order.customer_topic(
+            ContentType.objects.get_for_model(customer).model, customer.pk
+        )
+
+    async def wait_for_disconnect(self, receive):
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    async def reject(self, send, status, detail):
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,9 @@
+from rest_framework.routers import DefaultRouter
+from .views import OrderViewSet
+
+urlpatterns = []
+
+
+router = DefaultRouter()
+router.register("orders", OrderViewSet, basename="order")
+urlpatterns += router.urls
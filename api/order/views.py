@@ -1 +1,86 @@
-from rest_framework.viewsets import ModelViewSet
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import mixins
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+from .serializers import OrderCreateSerializer, OrderSerializer
+from api.exceptions import BadRequest
+from api.idempotency import IdempotentCreateMixin
+from api.permissions import IsAuthenticated
+from content.models import Order
+from services.order import Service
+
+
+class OrderViewSet(
+    IdempotentCreateMixin,
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    GenericViewSet,
+):
+    serializer_class = OrderSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "uuid"
+
+    def get_customer(self):
+        customer = self.request.user.get_profile()
+        if customer is None:
+            raise BadRequest(
+                {"detail": "User has no customer profile", "code": "no_profile"}
+            )
+
+        return customer
+
+    def get_queryset(self):
+        """The customer's orders; lists only cover ``get_list_since()`` onwards.
+
+        Orders are partitioned by month on ``created_at``, so the bound keeps
+        lists to the partitions inside the window. Lookups by uuid are not
+        bounded and probe the uuid index of every partition.
+        """
+        customer = self.get_customer()
+
+        queryset = Order.objects.filter(
+            customer_content_type=ContentType.objects.get_for_model(customer),
+            customer_object_id=customer.pk,
+        ).prefetch_related("items__product")
+
+        if self.action == "list":
+            queryset = queryset.filter(created_at__gte=self.get_list_since())
+
+        return queryset
+
+    def get_list_since(self):
+        since = self.request.query_params.get("since")
+        if since is None:
+            return timezone.now() - timedelta(days=settings.ORDER_LIST_DAYS)
+
+        try:
+            value = parse_datetime(since)
+        except ValueError:
+            value = None
+        if value is None:
+            raise BadRequest(
+                {"detail": "since must be an ISO 8601 date or time", "code": "invalid"}
+            )
+
+        return value if timezone.is_aware(value) else timezone.make_aware(value)
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return OrderCreateSerializer
+
+        return OrderSerializer
+
+    def perform_create(self, serializer):
+        serializer.save(customer=self.get_customer())
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, uuid=None):
+        order = Service.cancel_order(self.get_object())
+        return Response(self.get_serializer(order).data)
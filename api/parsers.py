@@ -0,0 +1,36 @@
+import io
+import re
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import JSONRenderer, orjson
+
+
+UTF8_ENCODINGS = ("utf-8", "utf8")
+
+# orjson reads integers wider than 64 bits as floats; json keeps them exact.
+LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+class JSONParser(parsers.JSONParser):
+    """DRF JSON parser backed by orjson for UTF-8 request bodies."""
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+
+        # orjson always rejects NaN/Infinity, which is what STRICT_JSON asks for.
+        if orjson is None or not self.strict or encoding.lower() not in UTF8_ENCODINGS:
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if LONG_NUMBER.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
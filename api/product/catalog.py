@@ -0,0 +1,103 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from api.renderers import JSONRenderer
+from common.compression import COMPRESSORS, compress
+from content.models import Product
+from .serializers import CatalogProductSerializer
+
+
+SNAPSHOT_PREFIX = "catalog-"
+
+# Versions start with the latest updated_at, so they sort by catalog age.
+EMPTY_STAMP = "0" * 20
+
+
+def catalog_version():
+    """Fingerprint of the catalog; changes whenever a product is saved or deleted.
+
+    Bulk updates count too, as ``Product.objects.update()`` bumps ``updated_at``.
+    """
+    state = Product.objects.aggregate(count=Count("id"), updated=Max("updated_at"))
+    updated = state["updated"]
+    raw = f"{state['count']}:{updated and updated.isoformat()}"
+    stamp = updated.strftime("%Y%m%d%H%M%S%f") if updated else EMPTY_STAMP
+    return f"{stamp}-{hashlib.sha1(raw.encode()).hexdigest()[:16]}"
+
+
+def snapshot_path(version, compressor_class=None):
+    suffix = compressor_class.suffix if compressor_class else ""
+    return os.path.join(
+        settings.CATALOG_SNAPSHOT_DIR, f"{SNAPSHOT_PREFIX}{version}.json{suffix}"
+    )
+
+
+def build_snapshot(version):
+    """Write the catalog export plus one precompressed copy per encoding."""
+    os.makedirs(settings.CATALOG_SNAPSHOT_DIR, exist_ok=True)
+
+    products = Product.objects.order_by("id")
+    data = CatalogProductSerializer(products, many=True).data
+    content = JSONRenderer().render(data)
+
+    # The plain file is written last: its presence marks a complete snapshot.
+    for compressor_class in COMPRESSORS:
+        _write(
+            snapshot_path(version, compressor_class),
+            compress(compressor_class, content, level=9),
+        )
+    _write(snapshot_path(version), content)
+
+    _remove_stale(version)
+
+
+def ensure_snapshot(version):
+    if not os.path.exists(snapshot_path(version)):
+        build_snapshot(version)
+
+
+def open_snapshot(version, compressor_class=None):
+    """Open a snapshot file, building it if missing.
+
+    A worker that built a newer version may remove this one between the
+    existence check and the open; it is rebuilt once in that case.
+    """
+    ensure_snapshot(version)
+    try:
+        return open(snapshot_path(version, compressor_class), "rb")
+    except FileNotFoundError:
+        build_snapshot(version)
+        return open(snapshot_path(version, compressor_class), "rb")
+
+
+def _write(path, content):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(content)
+    os.replace(tmp_path, path)
+
+
+def _remove_stale(version):
+    """Remove snapshots of older catalog versions, never newer ones."""
+    stamp = _stamp(f"{SNAPSHOT_PREFIX}{version}.json")
+
+    for filename in os.listdir(settings.CATALOG_SNAPSHOT_DIR):
+        if (
+            filename.startswith(SNAPSHOT_PREFIX)
+            and not filename.endswith(".tmp")
+            and _stamp(filename) < stamp
+        ):
+            try:
+                os.remove(os.path.join(settings.CATALOG_SNAPSHOT_DIR, filename))
+            except FileNotFoundError:
+                pass
+
+
+def _stamp(filename):
+    # Snapshots from before versions were stamped sort first.
+    version = filename[len(SNAPSHOT_PREFIX) :].split(".", 1)[0]
+    stamp, _, digest = version.partition("-")
+    return stamp if digest else ""
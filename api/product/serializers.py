@@ -5,4 +5,13 @@ from content.models import Product
 class ProductSerializer(ModelSerializer):
     class Meta:
         model = Product
-        fields = "__all__"
+        # Integer ids stay internal; products are exposed by uuid.
+        exclude = ["id"]
+
+
+class CatalogProductSerializer(ModelSerializer):
+    """Catalog export; stock is left out as it changes with every order."""
+
+    class Meta:
+        model = Product
+        exclude = ["id", "stock"]
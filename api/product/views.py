@@ -1,8 +1,59 @@
+from django.core.exceptions import ValidationError
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from .serializers import ProductSerializer
+from . import catalog
+from common import identity
+from common.compression import negotiate
 from content.models import Product
 
 
 class ProductViewSet(ReadOnlyModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
+    lookup_field = "uuid"
+
+    def get_object(self):
+        try:
+            product = identity.get(
+                self.get_queryset(), uuid=self.kwargs[self.lookup_field]
+            )
+        except (Product.DoesNotExist, ValidationError):
+            raise Http404
+
+        self.check_object_permissions(self.request, product)
+        return product
+
+    @action(detail=True)
+    def related(self, request, uuid=None):
+        """Frequently bought together, precomputed by `build_recommendations`."""
+        products = Product.objects.filter(
+            recommended_for__product=self.get_object()
+        ).order_by("recommended_for__rank")
+        return Response(self.get_serializer(products, many=True).data)
+
+    @action(detail=False)
+    def export(self, request):
+        """Full catalog as JSON, served from precompressed snapshot files."""
+        version = catalog.catalog_version()
+        compressor_class = negotiate(request.headers.get("Accept-Encoding"))
+        encoding = compressor_class.encoding if compressor_class else "identity"
+        etag = f'"{version}-{encoding}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(
+                catalog.open_snapshot(version, compressor_class),
+                content_type="application/json",
+                filename="catalog.json",
+            )
+            if compressor_class:
+                response.headers["Content-Encoding"] = encoding
+
+        response.headers["ETag"] = etag
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
@@ -0,0 +1,85 @@
+import math
+import re
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson
+    else 0
+)
+
+# orjson writes floats below 1e-4 as 1e-7 or 0.00001 where json writes 1e-07/1e-05.
+SHORT_FLOAT = re.compile(rb"e-\d(?!\d)|(?<![\d.])0\.0000")
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """DRF JSON renderer backed by orjson.
+
+    Produces the same bytes as DRF's renderer for compact, unicode output:
+    datetimes and anything orjson does not know natively are handed to DRF's
+    own encoder. Indented output, ASCII-only output and values orjson cannot
+    represent (e.g. integers wider than 64 bits) use the stdlib path, as do
+    NaN and infinities, which orjson would silently write as ``null``, and
+    floats below 1e-4, which it formats differently.
+    """
+
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self._encoder.default, option=ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if b"null" in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if SHORT_FLOAT.search(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep DRF's escaping of U+2028/U+2029 so output stays a JS subset.
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+
+        return ret
+
+
+def _has_non_finite_float(data):
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return False
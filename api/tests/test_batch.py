@@ -0,0 +1,101 @@
+import gc
+import tempfile
+import warnings
+from unittest import mock
+
+from django.core.signals import request_finished
+from django.test import override_settings
+from django.urls import reverse
+
+from common.testing.cases import APITestCase
+from common.testing.factories import CompanyFactory, OrderFactory, ProductFactory
+
+
+class BatchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CompanyFactory.create()
+        cls.order = OrderFactory.create(customer=cls.company)
+        cls.product = ProductFactory.create()
+
+    def batch(self, *paths):
+        response = self.client.post(
+            reverse("batch"),
+            {"requests": [{"path": path} for path in paths]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        return [(item["status"], item["body"]) for item in response.json()["responses"]]
+
+    def test_only_api_routes_are_served(self):
+        statuses = [status for status, _ in self.batch("/admin/", "/api/missing/")]
+
+        self.assertEqual(statuses, [404, 404])
+
+    def test_batches_cannot_be_nested(self):
+        [(status, body)] = self.batch(reverse("batch"))
+
+        self.assertEqual(status, 400)
+        self.assertEqual(body, {"detail": "Batch requests cannot be nested."})
+
+    def test_each_sub_request_has_its_own_status(self):
+        results = self.batch(
+            f"/api/products/{self.product.uuid}/",
+            "/api/products/00000000-0000-0000-0000-000000000000/",
+        )
+
+        self.assertEqual([status for status, _ in results], [200, 404])
+        self.assertEqual(results[0][1]["uuid"], str(self.product.uuid))
+
+    def test_sub_requests_run_as_the_batch_user(self):
+        self.authenticate(self.company.user)
+
+        [(status, body)] = self.batch("/api/orders/")
+
+        self.assertEqual(status, 200)
+        self.assertEqual([order["uuid"] for order in body], [str(self.order.uuid)])
+
+    def test_anonymous_sub_requests_match_the_direct_route(self):
+        direct = self.client.get("/api/orders/")
+
+        [(status, _)] = self.batch("/api/orders/")
+
+        self.assertEqual(status, direct.status_code)
+        self.assertEqual(status, 401)
+
+    def test_non_api_responses_are_rejected_and_closed(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(CATALOG_SNAPSHOT_DIR=directory),
+            warnings.catch_warnings(record=True) as caught,
+        ):
+            warnings.simplefilter("always", ResourceWarning)
+            [(status, body)] = self.batch("/api/products/export/")
+            gc.collect()
+
+        self.assertEqual(status, 400)
+        self.assertEqual(body, {"detail": "Not available in batch requests."})
+        self.assertFalse(
+            [w for w in caught if issubclass(w.category, ResourceWarning)]
+        )
+
+    def test_sub_requests_do_not_finish_the_batch_request(self):
+        receiver = mock.Mock()
+        request_finished.connect(receiver)
+        self.addCleanup(request_finished.disconnect, receiver)
+
+        self.batch("/api/products/", f"/api/products/{self.product.uuid}/")
+
+        # Only the batch response itself; closing sub-responses must not end
+        # the request and close its database connections.
+        self.assertEqual(receiver.call_count, 1)
+
+    @mock.patch("api.batch.views.logger")
+    def test_failing_sub_request_is_a_500_entry(self, logger):
+        with mock.patch(
+            "api.product.views.ProductViewSet.list", side_effect=RuntimeError
+        ):
+            [(status, body)] = self.batch("/api/products/")
+
+        self.assertEqual((status, body), (500, None))
+        logger.exception.assert_called_once()
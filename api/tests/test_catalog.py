@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+from django.test import override_settings
+
+from api.product import catalog
+from common.compression import GzipCompressor
+from common.testing.cases import TestCase
+from common.testing.factories import ProductFactory
+from content.models import Product
+
+
+class CatalogVersionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.products = ProductFactory.create_batch(2)
+
+    def test_bulk_updates_change_the_version(self):
+        before = catalog.catalog_version()
+        Product.objects.filter(pk=self.products[0].pk).update(name="Renamed")
+        after_update = catalog.catalog_version()
+
+        self.products[1].name = "Renamed too"
+        Product.objects.bulk_update([self.products[1]], ["name"])
+        after_bulk_update = catalog.catalog_version()
+
+        self.assertLess(before, after_update)
+        self.assertLess(after_update, after_bulk_update)
+
+    def test_deletes_change_the_version(self):
+        before = catalog.catalog_version()
+        Product.objects.filter(pk=self.products[0].pk).delete()
+
+        self.assertNotEqual(catalog.catalog_version(), before)
+
+
+class CatalogSnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = ProductFactory.create()
+
+    def setUp(self):
+        super().setUp()
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(CATALOG_SNAPSHOT_DIR=directory))
+
+        self.older = catalog.catalog_version()
+        Product.objects.filter(pk=self.product.pk).update(name="Renamed")
+        self.newer = catalog.catalog_version()
+
+    def test_building_an_older_version_keeps_newer_snapshots(self):
+        catalog.build_snapshot(self.newer)
+        catalog.build_snapshot(self.older)
+
+        self.assertTrue(os.path.exists(catalog.snapshot_path(self.newer)))
+        self.assertTrue(
+            os.path.exists(catalog.snapshot_path(self.newer, GzipCompressor))
+        )
+
+    def test_building_a_newer_version_removes_older_snapshots(self):
+        catalog.build_snapshot(self.older)
+        catalog.build_snapshot(self.newer)
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(catalog.snapshot_path(self.newer)))),
+            sorted(
+                os.path.basename(catalog.snapshot_path(self.newer, compressor_class))
+                for compressor_class in [None, *catalog.COMPRESSORS]
+            ),
+        )
+
+    def test_open_rebuilds_a_snapshot_removed_after_the_check(self):
+        catalog.build_snapshot(self.older)
+        os.remove(catalog.snapshot_path(self.older, GzipCompressor))
+
+        with catalog.open_snapshot(self.older, GzipCompressor) as fp:
+            self.assertTrue(fp.read())
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from api.models import IdempotencyKey
+from common.testing.cases import APITestCase
+from common.testing.factories import CompanyFactory, ProductFactory
+from content.models import Order, OrderItem, Product
+
+
+class IdempotentOrderCreateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CompanyFactory.create()
+        cls.product = ProductFactory.create(stock=10)
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate(self.company.user)
+
+    def create(self, key, quantity=1):
+        return self.client.post(
+            "/api/orders/",
+            {"items": [{"product": str(self.product.uuid), "quantity": quantity}]},
+            format="json",
+            headers={"Idempotency-Key": key},
+        )
+
+    def assertCounts(self, orders, keys):
+        self.assertEqual(Order.objects.count(), orders)
+        self.assertEqual(OrderItem.objects.count(), orders)
+        self.assertEqual(IdempotencyKey.objects.count(), keys)
+
+    def test_retry_replays_the_stored_response(self):
+        first = self.create("checkout-1")
+        second = self.create("checkout-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertNotIn("Idempotent-Replayed", first.headers)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(second.json(), first.json())
+        self.assertCounts(orders=1, keys=1)
+        self.assertEqual(Product.objects.get(pk=self.product.pk).stock, 9)
+
+    def test_other_payload_under_the_same_key_conflicts(self):
+        self.create("checkout-1")
+        response = self.create("checkout-1", quantity=2)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["code"], "idempotency_key_reused")
+        self.assertCounts(orders=1, keys=1)
+
+    def test_expired_key_runs_again(self):
+        first = self.create("checkout-1")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        second = self.create("checkout-1")
+
+        self.assertEqual(second.status_code, 201)
+        self.assertNotIn("Idempotent-Replayed", second.headers)
+        self.assertNotEqual(second.json()["uuid"], first.json()["uuid"])
+        self.assertCounts(orders=2, keys=1)
+        self.assertGreater(IdempotencyKey.objects.get().expires_at, timezone.now())
+
+    def test_failed_create_stores_nothing(self):
+        response = self.create("checkout-1", quantity=11)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["code"], "out_of_stock")
+        self.assertCounts(orders=0, keys=0)
+
+        # The key stays free for a corrected retry.
+        self.assertEqual(self.create("checkout-1", quantity=11).status_code, 409)
+        Product.objects.filter(pk=self.product.pk).update(stock=11)
+        retry = self.create("checkout-1", quantity=11)
+        self.assertEqual(retry.status_code, 201)
+        self.assertNotIn("Idempotent-Replayed", retry.headers)
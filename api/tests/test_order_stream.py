@@ -0,0 +1,113 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.pubsub import Broker, _uses_listen
+from common.testing.cases import TransactionTestCase
+from common.testing.factories import CompanyFactory, OrderFactory
+from content.models import Order
+from settings.asgi import application
+
+
+class OrderStreamTests(TransactionTestCase):
+    streams = 10_000
+
+    def setUp(self):
+        super().setUp()
+        self.company = CompanyFactory.create()
+        self.order = OrderFactory.create(customer=self.company)
+        token = RefreshToken.for_user(self.company.user).access_token
+        self.scope = {
+            "type": "http",
+            "path": "/api/orders/stream/",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "query_string": b"",
+        }
+
+        # A fresh broker, so its listener runs on this test's event loop.
+        self.broker = Broker(queue_size=10)
+        for target in ("common.pubsub.broker", "api.order.stream.broker"):
+            patcher = mock.patch(target, self.broker)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_idle_streams_share_one_listener(self):
+        disconnect = asyncio.Event()
+        sent = [[] for _ in range(self.streams)]
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        def sender(messages):
+            async def send(message):
+                messages.append(message)
+
+            return send
+
+        streams = [
+            asyncio.create_task(application(self.scope, receive, sender(messages)))
+            for messages in sent
+        ]
+        try:
+            await self.wait_for(lambda: all(sent), "all streams to start")
+            if _uses_listen():
+                await self.wait_for(self.listening, "the LISTEN connection")
+                # The test's own connection plus the broker's listener.
+                self.assertLessEqual(await self.backends(), 2)
+
+            self.order.status = Order.Status.CANCELED
+            await sync_to_async(self.order.save)()
+
+            await self.wait_for(
+                lambda: all(map(self.events, sent)), "the event to reach every stream"
+            )
+        finally:
+            disconnect.set()
+            await asyncio.gather(*streams)
+            if self.broker._listener is not None:
+                self.broker._listener.cancel()
+                await asyncio.gather(self.broker._listener, return_exceptions=True)
+
+        self.assertTrue(all(messages[0]["status"] == 200 for messages in sent))
+        # Exactly one event each; heartbeats may come in between.
+        self.assertTrue(all(len(self.events(messages)) == 1 for messages in sent))
+        self.assertIn(str(self.order.uuid).encode(), self.events(sent[0])[0])
+        self.assertEqual(self.broker._subscribers, {})
+
+    def events(self, messages):
+        return [
+            message["body"]
+            for message in messages[1:]
+            if message["body"].startswith(b"event: order.status")
+        ]
+
+    async def wait_for(self, condition, what, timeout=30):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not await sync_to_async(condition)():
+            if loop.time() > deadline:
+                self.fail(f"Timed out waiting for {what}")
+            await asyncio.sleep(0.05)
+
+    def listening(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_stat_activity "
+                "WHERE datname = current_database() AND query = 'LISTEN events' "
+                "AND state = 'idle'"
+            )
+            return cursor.fetchone() is not None
+
+    @sync_to_async
+    def backends(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND pid <> pg_backend_pid() "
+                "AND backend_type = 'client backend'"
+            )
+            return cursor.fetchone()[0] + 1
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from common.testing.cases import APITestCase
+from common.testing.factories import CompanyFactory, OrderFactory
+from content.models import Order
+
+
+class OrderListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CompanyFactory.create()
+        cls.recent, cls.old = OrderFactory.create_batch(2, customer=cls.company)
+        Order.objects.filter(pk=cls.old.pk).update(
+            created_at=timezone.now() - timedelta(days=200)
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate(self.company.user)
+
+    def listed(self, **params):
+        response = self.client.get("/api/orders/", params)
+        self.assertEqual(response.status_code, 200)
+        return {order["uuid"] for order in response.json()}
+
+    def test_lists_the_recent_window_by_default(self):
+        self.assertEqual(self.listed(), {str(self.recent.uuid)})
+
+    def test_since_moves_the_window(self):
+        since = (timezone.now() - timedelta(days=365)).date().isoformat()
+
+        self.assertEqual(
+            self.listed(since=since), {str(self.recent.uuid), str(self.old.uuid)}
+        )
+
+    def test_invalid_since_is_rejected(self):
+        response = self.client.get("/api/orders/", {"since": "last week"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_older_orders_are_still_retrieved_by_uuid(self):
+        response = self.client.get(f"/api/orders/{self.old.uuid}/")
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_orders_are_exposed_by_uuid_only(self):
+        response = self.client.get(f"/api/orders/{self.recent.uuid}/")
+
+        self.assertEqual(
+            set(response.json()),
+            {
+                "uuid",
+                "customer",
+                "status",
+                "total_amount",
+                "items",
+                "created_at",
+                "updated_at",
+            },
+        )
+        self.assertEqual(response.json()["customer"]["uuid"], str(self.company.uuid))
+
+    def test_other_customers_orders_are_not_found(self):
+        other = OrderFactory.create()
+
+        response = self.client.get(f"/api/orders/{other.uuid}/")
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,39 @@
+import io
+
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from api.parsers import JSONParser
+from common.testing.cases import TestCase
+
+
+class JSONParserTests(TestCase):
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), "application/json", {})
+
+    def test_matches_drf_output(self):
+        body = (
+            b'{"name": "Box \\u2028 \\u00e9", "ratio": 0.5, "rates": [1e-7, 1e-07],'
+            b' "max": 18446744073709551615, "items": [{"quantity": 2}], "image": null}'
+        )
+
+        self.assertEqual(
+            self.parse(JSONParser(), body), self.parse(parsers.JSONParser(), body)
+        )
+
+    def test_keeps_integers_wider_than_64_bits(self):
+        for number in (
+            123456789012345678901234567890,
+            -9223372036854775809,
+            18446744073709551616,
+        ):
+            with self.subTest(number=number):
+                data = self.parse(JSONParser(), b'{"a": [%d]}' % number)
+
+                self.assertEqual(data, {"a": [number]})
+                self.assertIsInstance(data["a"][0], int)
+
+    def test_rejects_invalid_json(self):
+        for body in (b'{"a": NaN}', b'{"a": 1', b'{"a": 1234567890123456789'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(JSONParser(), body)
@@ -0,0 +1,30 @@
+from common.testing.cases import APITestCase
+from common.testing.factories import ProductFactory
+
+
+class ProductRouteTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = ProductFactory.create()
+
+    def test_detail_by_uuid(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/products/{self.product.uuid}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["uuid"], str(self.product.uuid))
+        self.assertNotIn("id", response.json())
+
+    def test_unknown_or_malformed_uuid_is_not_found(self):
+        for uuid in ("00000000-0000-0000-0000-000000000000", "not-a-uuid"):
+            with self.subTest(uuid=uuid):
+                response = self.client.get(f"/api/products/{uuid}/")
+                self.assertEqual(response.status_code, 404)
+
+    def test_list_leaves_out_integer_ids(self):
+        response = self.client.get("/api/products/")
+
+        self.assertEqual(response.status_code, 200)
+        (product,) = response.json()
+        self.assertEqual(product["uuid"], str(self.product.uuid))
+        self.assertNotIn("id", product)
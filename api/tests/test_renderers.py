@@ -0,0 +1,33 @@
+import datetime
+from decimal import Decimal
+
+from rest_framework import renderers
+
+from api.renderers import JSONRenderer
+from common.testing.cases import TestCase
+
+
+class JSONRendererTests(TestCase):
+    def test_matches_drf_output(self):
+        data = {
+            "name": "Box \u2028 \u00e9",
+            "price": Decimal("12.50"),
+            "created_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901),
+            "image": None,
+            "ratio": 0.5,
+            "rates": [1e-7, 1.5e-05, 2.5e-10, 1e16],
+            "reference": 123456789012345678901234567890,
+            3: [1, 2],
+        }
+
+        self.assertEqual(
+            JSONRenderer().render(data), renderers.JSONRenderer().render(data)
+        )
+
+    def test_rejects_non_finite_floats_like_drf(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    renderers.JSONRenderer().render({"a": [{"b": value}]})
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"a": [{"b": value}]})
@@ -1,4 +1,8 @@
 from django.urls import path, include
 
 
-urlpatterns = [path("", include("api.product.urls"))]
+urlpatterns = [
+    path("", include("api.product.urls")),
+    path("", include("api.order.urls")),
+    path("", include("api.batch.urls")),
+]
@@ -0,0 +1,142 @@
+import secrets
+import string
+import struct
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class GzipCompressor:
+    """Gzip with a random-length file name in the header.
+
+    Like Django's ``GZipMiddleware``, the padding varies the response length
+    to make BREACH-style attacks, which compare compressed sizes, harder.
+    """
+
+    encoding = "gzip"
+    suffix = ".gz"
+
+    def __init__(self, level=6, max_random_bytes=100):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._crc = 0
+        self._size = 0
+
+        flags, name = 0, b""
+        if max_random_bytes:
+            flags = 0x08  # FNAME
+            name = (
+                "".join(
+                    secrets.choice(string.ascii_letters)
+                    for _ in range(secrets.randbelow(max_random_bytes) + 1)
+                ).encode()
+                + b"\0"
+            )
+        # Magic, deflate, flags, mtime 0, no extra flags, unknown OS.
+        self._header = b"\x1f\x8b\x08" + bytes([flags]) + b"\0\0\0\0\0\xff" + name
+
+    def compress(self, data):
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        return self._take_header() + self._compressor.compress(data)
+
+    def flush(self):
+        return self._take_header() + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return (
+            self._take_header()
+            + self._compressor.flush()
+            + struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+        )
+
+    def _take_header(self):
+        header, self._header = self._header, b""
+        return header
+
+
+class BrotliCompressor:
+    encoding = "br"
+    suffix = ".br"
+
+    def __init__(self, level=5):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    encoding = "zstd"
+    suffix = ".zst"
+
+    def __init__(self, level=3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+# Ordered by preference when the client accepts several encodings equally.
+COMPRESSORS = [
+    compressor
+    for compressor, available in (
+        (BrotliCompressor, brotli is not None),
+        (ZstdCompressor, zstandard is not None),
+        (GzipCompressor, True),
+    )
+    if available
+]
+
+
+def negotiate(accept_encoding):
+    """Return the compressor class best matching an Accept-Encoding header."""
+    weights = {}
+
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for compressor in COMPRESSORS:
+        weight = weights.get(compressor.encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = compressor, weight
+
+    return best
+
+
+def compress(compressor_class, data, **kwargs):
+    compressor = compressor_class(**kwargs)
+    return compressor.compress(data) + compressor.finish()
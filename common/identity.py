@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+_identities = ContextVar("identities", default=None)
+
+
+@contextmanager
+def identity_map():
+    """Share loaded instances between lookups for the duration of the block.
+
+    Used per request, so an instance fetched once by the authentication,
+    view and serializers is not loaded again. Instances are not refreshed
+    inside the block; code that needs current values must query directly.
+    """
+    token = _identities.set({})
+    try:
+        yield
+    finally:
+        _identities.reset(token)
+
+
+def get(queryset, **lookup):
+    """``queryset.get(**lookup)`` on a single field, through the identity map.
+
+    Only use with querysets that are not scoped to a user or otherwise
+    filtered, since a hit returns whatever instance was loaded first.
+    """
+    ((field, value),) = lookup.items()
+
+    identities = _identities.get()
+    if identities is None:
+        return queryset.get(**lookup)
+
+    model = queryset.model
+    if field == "pk":
+        field = model._meta.pk.name
+
+    key = (model._meta.label, field, str(value))
+    instance = identities.get(key)
+    if instance is None:
+        instance = queryset.get(**lookup)
+        add(instance)
+        identities[key] = instance
+
+    return instance
+
+
+def add(instance):
+    """Register ``instance`` under its primary key and UUID."""
+    identities = _identities.get()
+    if identities is None:
+        return
+
+    label = instance._meta.label
+    identities[(label, instance._meta.pk.name, str(instance.pk))] = instance
+
+    uuid = getattr(instance, "uuid", None)
+    if uuid is not None:
+        identities[(label, "uuid", str(uuid))] = instance
@@ -0,0 +1,146 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Boots the project the way a WSGI worker does and serves one request.
+BOOT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+
+import django
+django.setup()
+setup = time.perf_counter()
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.urls import get_resolver
+handler = WSGIHandler()
+get_resolver().url_patterns
+ready = time.perf_counter()
+
+path, host = sys.argv[1], sys.argv[2]
+environ = {
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": path,
+    "QUERY_STRING": "",
+    "SERVER_NAME": host,
+    "SERVER_PORT": "80",
+    "HTTP_HOST": host,
+    "wsgi.url_scheme": "http",
+    "wsgi.input": __import__("io").BytesIO(),
+    "wsgi.errors": sys.stderr,
+}
+statuses = []
+response = handler(environ, lambda status, headers: statuses.append(status))
+b"".join(response)
+response.close()
+served = time.perf_counter()
+
+print(json.dumps({
+    "setup": setup - start,
+    "ready": ready - start,
+    "served": served - start,
+    "status": statuses[0],
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure worker boot: time to the first served request and "
+        "-X importtime costs grouped per app or package."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/products/")
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *args, **options):
+        host = next(
+            (host for host in settings.ALLOWED_HOSTS if "*" not in host),
+            "localhost",
+        )
+        if host.startswith("."):
+            host = host[1:]
+
+        runs = [self._boot(options["path"], host) for _ in range(options["runs"])]
+
+        for phase in ("setup", "ready", "served", "total"):
+            median = statistics.median(run[phase] for run in runs)
+            self.stdout.write(f"{phase:>8}: {median * 1000:8.1f} ms")
+        self.stdout.write(f"{'status':>8}: {runs[-1]['status']}")
+        self.stdout.write("")
+
+        # Import costs from the last run; self time, so packages don't overlap.
+        self_times = defaultdict(int)
+        counts = defaultdict(int)
+        for name, self_us in runs[-1]["imports"]:
+            group = self._group(name)
+            self_times[group] += self_us
+            counts[group] += 1
+
+        total = sum(self_times.values())
+        self.stdout.write(f"{'package':<32}{'modules':>8}{'ms':>10}{'share':>8}")
+        ranked = sorted(self_times.items(), key=lambda item: -item[1])
+        for group, self_us in ranked[: options["limit"]]:
+            self.stdout.write(
+                f"{group:<32}{counts[group]:>8}{self_us / 1000:>10.1f}"
+                f"{self_us / total:>8.1%}"
+            )
+        self.stdout.write(
+            f"{'total':<32}{sum(counts.values()):>8}{total / 1000:>10.1f}"
+        )
+
+    def _boot(self, path, host):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get(
+                "DJANGO_SETTINGS_MODULE", "settings.settings"
+            ),
+        }
+        env.pop("PYTHONPROFILEIMPORTTIME", None)
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT, path, host],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - start
+
+        output = result.stdout.strip().splitlines()
+        if result.returncode or not output:
+            raise CommandError(result.stderr[-2000:])
+
+        timings = json.loads(output[-1])
+        # Includes interpreter startup, which the child cannot see.
+        timings["total"] = elapsed
+        timings["imports"] = self._parse_importtime(result.stderr)
+        return timings
+
+    def _parse_importtime(self, stderr):
+        imports = []
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _, name = line[len("import time:") :].split("|")
+            imports.append((name.strip(), int(self_us)))
+        return imports
+
+    def _group(self, name):
+        package = name.split(".")[0]
+        if os.path.isdir(os.path.join(settings.BASE_DIR, package)):
+            return f"{package} (project)"
+        if package.startswith("_") or package in sys.stdlib_module_names:
+            return "stdlib"
+        return package
@@ -0,0 +1,331 @@
+import fcntl
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+ARCHIVE_FILE = "metrics-archive.json"
+
+
+class Registry:
+    """In-process metrics registry with optional file-based aggregation.
+
+    When ``METRICS_DIR`` is set, every worker process periodically dumps its
+    samples to ``<METRICS_DIR>/metrics-<pid>.json`` and a scrape sums the
+    files of all workers, so the numbers are correct behind a pre-forking
+    server such as gunicorn. Files of exited workers are folded into
+    ``metrics-archive.json`` on scrape, keeping their counters and
+    histograms but dropping their gauges. Collectors added with
+    ``add_collector`` refresh gauges on every flush, so each worker's file
+    holds its own current values rather than whatever it last served.
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._samples = {}
+        self._collectors = []
+        self._last_flush = 0.0
+
+    def describe(self, name, kind, help_text, buckets=None):
+        self._metrics[name] = {
+            "kind": kind,
+            "help": help_text,
+            "buckets": list(buckets or DEFAULT_BUCKETS),
+        }
+
+    def add_collector(self, collector):
+        """Register a callable yielding ``(name, value, labels)`` gauge samples."""
+        self._collectors.append(collector)
+
+    def inc(self, name, labels=None, value=1):
+        key = self._key(name, labels)
+
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + value
+
+        self._maybe_flush()
+
+    def set(self, name, value, labels=None):
+        key = self._key(name, labels)
+
+        with self._lock:
+            self._samples[key] = value
+
+        self._maybe_flush()
+
+    def observe(self, name, value, labels=None):
+        key = self._key(name, labels)
+        buckets = self._metrics[name]["buckets"]
+
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                # One slot per bucket plus +Inf, followed by sum and count.
+                sample = self._samples[key] = [0] * (len(buckets) + 3)
+
+            sample[bisect_left(buckets, value)] += 1
+            sample[-2] += value
+            sample[-1] += 1
+
+        self._maybe_flush()
+
+    def collect(self):
+        """Return samples of every worker, summed per metric and label set."""
+        if not self.directory:
+            self._run_collectors()
+            with self._lock:
+                return self._copy(self._samples)
+
+        self.flush()
+        self._archive_exited_workers()
+        totals = {}
+
+        for filename in os.listdir(self.directory):
+            if not filename.startswith("metrics-") or not filename.endswith(".json"):
+                continue
+
+            self._merge(totals, self._read(filename))
+
+        return totals
+
+    def flush(self):
+        if not self.directory:
+            return
+
+        self._run_collectors()
+        with self._lock:
+            samples = [
+                [name, [list(pair) for pair in labels], value]
+                for (name, labels), value in self._samples.items()
+            ]
+            self._last_flush = time.monotonic()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._write(f"metrics-{os.getpid()}.json", samples)
+
+    def render(self):
+        """Render all samples in the Prometheus text exposition format."""
+        samples = self.collect()
+        lines = []
+
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['kind']}")
+
+            for (sample_name, labels), value in sorted(samples.items()):
+                if sample_name != name:
+                    continue
+
+                if metric["kind"] != HISTOGRAM:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+                    continue
+
+                cumulative = 0
+                bounds = [str(bound) for bound in metric["buckets"]] + ["+Inf"]
+                for bound, count in zip(bounds, value):
+                    cumulative += count
+                    bucket_labels = labels + (("le", bound),)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                    )
+
+                lines.append(f"{name}_sum{_format_labels(labels)} {value[-2]}")
+                lines.append(f"{name}_count{_format_labels(labels)} {value[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+    def _run_collectors(self):
+        samples = [sample for collector in self._collectors for sample in collector()]
+
+        with self._lock:
+            for name, value, labels in samples:
+                self._samples[self._key(name, labels)] = value
+
+    def _archive_exited_workers(self):
+        exited = [
+            filename
+            for filename in os.listdir(self.directory)
+            if _worker_pid(filename) is not None
+            and not _is_running(_worker_pid(filename))
+        ]
+        if not exited:
+            return
+
+        # Workers scraping at the same time must not archive a file twice.
+        with open(os.path.join(self.directory, "metrics.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            archive = {}
+            self._merge(archive, self._read(ARCHIVE_FILE))
+
+            merged = []
+            for filename in exited:
+                if not os.path.exists(os.path.join(self.directory, filename)):
+                    continue
+                samples = self._read(filename)
+                self._merge(
+                    archive,
+                    [sample for sample in samples if not self._is_gauge(sample[0])],
+                )
+                merged.append(filename)
+
+            self._write(
+                ARCHIVE_FILE,
+                [
+                    [name, [list(pair) for pair in labels], value]
+                    for (name, labels), value in archive.items()
+                ],
+            )
+            for filename in merged:
+                os.unlink(os.path.join(self.directory, filename))
+
+    def _read(self, filename):
+        try:
+            with open(os.path.join(self.directory, filename)) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return []
+
+    def _write(self, filename, samples):
+        path = os.path.join(self.directory, filename)
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w") as fp:
+            json.dump(samples, fp)
+
+        os.replace(tmp_path, path)
+
+    def _merge(self, totals, samples):
+        for name, labels, value in samples:
+            key = (name, tuple(tuple(pair) for pair in labels))
+
+            if isinstance(value, list):
+                current = totals.setdefault(key, [0] * len(value))
+                for index, count in enumerate(value):
+                    current[index] += count
+            else:
+                totals[key] = totals.get(key, 0) + value
+
+    def _is_gauge(self, name):
+        return self._metrics.get(name, {}).get("kind") == GAUGE
+
+    def _maybe_flush(self):
+        if (
+            self.directory
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((labels or {}).items()))
+
+    @staticmethod
+    def _copy(samples):
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in samples.items()
+        }
+
+
+def _worker_pid(filename):
+    if not filename.startswith("metrics-") or not filename.endswith(".json"):
+        return None
+
+    pid = filename[len("metrics-") : -len(".json")]
+    return int(pid) if pid.isdigit() else None
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _pool_stats():
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None or not hasattr(pool, "get_stats"):
+            continue
+
+        stats = pool.get_stats()
+        for state in ("pool_size", "pool_available", "requests_waiting"):
+            yield "db_pool_connections", stats.get(state, 0), {
+                "alias": alias,
+                "state": state,
+            }
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+registry = Registry(directory=getattr(settings, "METRICS_DIR", None))
+
+registry.describe(
+    "http_requests_total", COUNTER, "Total HTTP requests by route, method and status."
+)
+registry.describe(
+    "http_request_duration_seconds",
+    HISTOGRAM,
+    "HTTP request latency by route and method.",
+)
+registry.describe(
+    "db_connections_opened_total", COUNTER, "Database connections opened."
+)
+registry.describe(
+    "db_query_duration_seconds", HISTOGRAM, "Database query latency by alias."
+)
+registry.describe(
+    "db_pool_connections",
+    GAUGE,
+    "Connection pool statistics by alias and state.",
+)
+registry.add_collector(_pool_stats)
+registry.describe(
+    "cache_requests_total", COUNTER, "Cache lookups by cache name and result."
+)
+registry.describe(
+    "auth_password_check_duration_seconds",
+    HISTOGRAM,
+    "Time spent verifying password hashes on login.",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0),
+)
+
+
+def record_cache(cache_name, hit):
+    registry.inc(
+        "cache_requests_total",
+        {"cache": cache_name, "result": "hit" if hit else "miss"},
+    )
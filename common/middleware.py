@@ -0,0 +1,157 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from .compression import negotiate
+from .identity import identity_map
+from .metrics import registry
+
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# HTML pages (e.g. the admin) carry CSRF tokens next to reflected input, the
+# setup BREACH exploits; brotli and zstd have no header to pad like gzip.
+UNCOMPRESSED_TYPES = ("text/html",)
+
+
+class MetricsMiddleware:
+    """Record per-route request counts, latency and database query timings."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(_QueryTimer(alias))
+                )
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else "unmatched"
+        labels = {"route": route, "method": request.method}
+
+        registry.observe(
+            "http_request_duration_seconds", time.perf_counter() - start, labels
+        )
+        registry.inc(
+            "http_requests_total", {**labels, "status": str(response.status_code)}
+        )
+
+        return response
+
+
+class _QueryTimer:
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            registry.observe(
+                "db_query_duration_seconds",
+                time.perf_counter() - start,
+                {"alias": self.alias},
+            )
+
+
+class IdentityMapMiddleware:
+    """Scope an identity map to each request; see ``common.identity``."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map():
+            return self.get_response(request)
+
+
+class CompressionMiddleware:
+    """Compress responses with the best of brotli, zstd and gzip the client accepts.
+
+    Responses below ``COMPRESSION_MIN_SIZE`` bytes, HTML, non-text content
+    and responses that already carry a Content-Encoding (e.g. precompressed
+    files) are passed through untouched. Streaming responses are compressed
+    chunk by chunk, flushing after each chunk so clients see data as it is
+    produced.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        content_type = response.get("Content-Type", "")
+        if (
+            response.has_header("Content-Encoding")
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+            or content_type.startswith(UNCOMPRESSED_TYPES)
+        ):
+            return response
+
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        compressor_class = negotiate(request.META.get("HTTP_ACCEPT_ENCODING"))
+        if compressor_class is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _compress_async(
+                    compressor_class(), response.streaming_content
+                )
+            else:
+                response.streaming_content = _compress(
+                    compressor_class(), response.streaming_content
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressor = compressor_class()
+            content = compressor.compress(response.content) + compressor.finish()
+            if len(content) >= len(response.content):
+                return response
+
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = compressor_class.encoding
+
+        return response
+
+
+def _compress(compressor, chunks):
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _compress_async(compressor, chunks):
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
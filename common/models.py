@@ -1,9 +1,41 @@
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
 import uuid
 
 # Create your models here.
 
 
+class CoveringUniqueConstraint(models.UniqueConstraint):
+    """Unique constraint that covers ``include`` where the database can.
+
+    Elsewhere (SQLite) it is a plain unique constraint on ``fields``, which
+    Django would otherwise skip altogether, leaving the fields unchecked.
+    """
+
+    def _for(self, schema_editor):
+        if schema_editor.connection.features.supports_covering_indexes:
+            return self
+
+        constraint = self.clone()
+        constraint.include = ()
+        return constraint
+
+    def constraint_sql(self, model, schema_editor):
+        if schema_editor.connection.features.supports_covering_indexes:
+            return super().constraint_sql(model, schema_editor)
+
+        # Added after the table, as covering ones are, so it has an index to drop.
+        schema_editor.deferred_sql.append(self.create_sql(model, schema_editor))
+        return None
+
+    def create_sql(self, model, schema_editor):
+        constraint = self._for(schema_editor)
+        return models.UniqueConstraint.create_sql(constraint, model, schema_editor)
+
+    def remove_sql(self, model, schema_editor):
+        constraint = self._for(schema_editor)
+        return models.UniqueConstraint.remove_sql(constraint, model, schema_editor)
+
+
 class AbstractModel(models.Model):
 
     uuid = models.UUIDField(
@@ -13,6 +45,96 @@ class AbstractModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Validate the instance on every save; see ``save``.
+    validate_on_save = False
+
     class Meta:
         abstract = True
         ordering = ["-created_at"]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if cls.validate_on_save:
+            instance._loaded_values = instance._field_values()
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save, validating first when ``validate_on_save`` is set.
+
+        Only fields changed since the instance was loaded (and, with
+        ``update_fields``, only those among them) are validated. Uniqueness
+        is left to the database: an ``IntegrityError`` is turned into the
+        ``ValidationError`` that ``full_clean`` would have raised, so
+        unique fields cost no extra query on the successful path.
+        """
+        if not self.validate_on_save:
+            return super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        self.clean_changed_fields(update_fields)
+
+        using = kwargs.get("using") or router.db_for_write(
+            self.__class__, instance=self
+        )
+        try:
+            if transaction.get_connection(using).in_atomic_block:
+                # Savepoint, so the enclosing transaction survives a failed write.
+                with transaction.atomic(using=using):
+                    super().save(*args, **kwargs)
+            else:
+                super().save(*args, **kwargs)
+        except IntegrityError:
+            self.validate_unique()
+            self.validate_constraints()
+            raise
+
+        values = self._field_values()
+        if update_fields is not None and hasattr(self, "_loaded_values"):
+            saved = {self._meta.get_field(name).attname for name in update_fields}
+            values = {
+                attname: values[attname] if attname in saved else loaded
+                for attname, loaded in self._loaded_values.items()
+            }
+        self._loaded_values = values
+
+    def get_changed_fields(self):
+        """Names of fields changed since load, or ``None`` for unsaved instances."""
+        if self._state.adding or not hasattr(self, "_loaded_values"):
+            return None
+
+        current = self._field_values()
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in current
+            and current[field.attname] != self._loaded_values.get(field.attname)
+        }
+
+    def clean_changed_fields(self, update_fields=None):
+        """``full_clean`` restricted to changed fields, without unique checks."""
+        changed = self.get_changed_fields()
+        if changed is None:
+            exclude = None
+        else:
+            if update_fields is not None:
+                changed &= {
+                    self._meta.get_field(name).name for name in update_fields
+                }
+            exclude = [
+                field.name
+                for field in self._meta.concrete_fields
+                if field.name not in changed
+            ]
+
+        self.full_clean(
+            exclude=exclude, validate_unique=False, validate_constraints=False
+        )
+
+    def _field_values(self):
+        # Deferred fields are left out, so they never count as changed.
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
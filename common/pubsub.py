@@ -0,0 +1,98 @@
+import asyncio
+import json
+import logging
+
+from django.db import connection, connections, transaction
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg = None
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "events"
+
+
+class Broker:
+    """Per-process fan-out of published messages to asyncio subscribers.
+
+    On PostgreSQL with psycopg 3 installed, a single ``LISTEN`` connection
+    per process feeds the broker, so any number of subscribers cost one
+    database connection. Elsewhere only messages published from the same
+    process are seen.
+    """
+
+    def __init__(self, queue_size=100, reconnect_delay=1.0):
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+
+        self._subscribers = {}
+        self._loop = None
+        self._listener = None
+
+    def subscribe(self, topic):
+        self._loop = asyncio.get_running_loop()
+        if self._listener is None and _uses_listen():
+            self._listener = asyncio.create_task(self._listen())
+
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, topic, queue):
+        queues = self._subscribers.get(topic)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[topic]
+
+    def publish(self, topic, message):
+        for queue in self._subscribers.get(topic, ()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow consumer; it will catch up from the next message.
+                logger.warning("Dropping message for slow subscriber on %s", topic)
+
+    def publish_threadsafe(self, topic, message):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.publish, topic, message)
+
+    async def _listen(self):
+        params = connections["default"].get_connection_params()
+        params.pop("cursor_factory", None)
+        params.pop("context", None)
+
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(**params, autocommit=True)
+                async with conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    async for notification in conn.notifies():
+                        event = json.loads(notification.payload)
+                        self.publish(event["topic"], event["message"])
+            except Exception:
+                logger.exception("Event listener failed, reconnecting")
+                await asyncio.sleep(self.reconnect_delay)
+
+
+broker = Broker()
+
+
+def _uses_listen():
+    return connection.vendor == "postgresql" and psycopg is not None
+
+
+def notify(topic, message):
+    """Publish ``message`` to ``topic`` subscribers once the transaction commits."""
+    if _uses_listen():
+        # NOTIFY is transactional: delivered on commit, dropped on rollback.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, %s)",
+                [CHANNEL, json.dumps({"topic": topic, "message": message})],
+            )
+    else:
+        transaction.on_commit(lambda: broker.publish_threadsafe(topic, message))
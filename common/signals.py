@@ -0,0 +1,9 @@
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .metrics import registry
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    registry.inc("db_connections_opened_total", {"alias": connection.alias})
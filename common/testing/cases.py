@@ -0,0 +1,42 @@
+from django.core.cache import caches
+from django.test import TestCase as DjangoTestCase
+from django.test import TransactionTestCase as DjangoTransactionTestCase
+from rest_framework.test import APIClient
+
+
+class TestCase(DjangoTestCase):
+    """Base test case for the project.
+
+    Build shared rows once per class in ``setUpTestData``, usually with
+    ``common.testing.factories``. Each test runs in a transaction that is
+    rolled back, and Django gives every test its own copy of the class
+    attributes, so tests can modify them freely. The caches are cleared
+    before each test: primary keys are reused after a rollback, so
+    per-user entries such as cached profiles would otherwise leak between
+    tests.
+    """
+
+    def setUp(self):
+        super().setUp()
+        for cache in caches.all():
+            cache.clear()
+
+
+class TransactionTestCase(DjangoTransactionTestCase):
+    """Base for tests that need real commits, such as concurrent writers or
+    notifications delivered on commit. Slower: tables are flushed after each
+    test instead of rolling back a transaction.
+    """
+
+    def setUp(self):
+        super().setUp()
+        for cache in caches.all():
+            cache.clear()
+
+
+class APITestCase(TestCase):
+    client_class = APIClient
+
+    def authenticate(self, user):
+        """Send the following requests as ``user``, skipping token handling."""
+        self.client.force_authenticate(user)
@@ -0,0 +1,177 @@
+import itertools
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+
+from access.models import User
+from content.models import Company, Order, OrderItem, Person, Product
+
+
+class Factory:
+    """Build model instances with default field values and insert them in bulk.
+
+    ``create_batch`` saves all instances with a single ``bulk_create`` and
+    creates missing ``related`` objects the same way, one query per model.
+    ``save()`` is skipped, and so are validation, signals and the outbox
+    events ``Order.save`` publishes. Tests that need those should call the
+    services instead.
+    """
+
+    model = None
+    # field name -> (factory, field overrides), created when not passed in.
+    related = {}
+
+    _counter = itertools.count(1)
+
+    @classmethod
+    def defaults(cls, n):
+        return {}
+
+    @classmethod
+    def prepare(cls, instance):
+        """Adjust a built instance once its fields and related objects are set."""
+        return instance
+
+    @classmethod
+    def build_batch(cls, size, **fields):
+        return [
+            cls.prepare(cls.model(**{**cls.defaults(next(cls._counter)), **fields}))
+            for _ in range(size)
+        ]
+
+    @classmethod
+    def create_batch(cls, size, **fields):
+        per_instance = [{} for _ in range(size)]
+        for name, (factory, overrides) in cls.related.items():
+            if name not in fields:
+                objects = factory.create_batch(size, **overrides)
+                for values, obj in zip(per_instance, objects):
+                    values[name] = obj
+
+        instances = [
+            cls.prepare(
+                cls.model(**{**cls.defaults(next(cls._counter)), **fields, **values})
+            )
+            for values in per_instance
+        ]
+        return cls.model.objects.bulk_create(instances)
+
+    @classmethod
+    def build(cls, **fields):
+        return cls.build_batch(1, **fields)[0]
+
+    @classmethod
+    def create(cls, **fields):
+        return cls.create_batch(1, **fields)[0]
+
+
+class UserFactory(Factory):
+    model = User
+    password = "password"
+
+    @classmethod
+    def defaults(cls, n):
+        return {
+            "email": f"user{n}@example.com",
+            "name": f"User {n}",
+            "user_type": User.UserType.PERSON,
+            "password": cls._password_hash(),
+        }
+
+    @classmethod
+    def _password_hash(cls):
+        # Hashed once per factory; hashing per user dominates large batches.
+        if "_hash" not in cls.__dict__:
+            cls._hash = make_password(cls.password)
+        return cls._hash
+
+
+class CompanyFactory(Factory):
+    model = Company
+    related = {"user": (UserFactory, {"user_type": User.UserType.COMPANY})}
+
+    @classmethod
+    def defaults(cls, n):
+        return {
+            "name": f"Company {n}",
+            "vat": 100000000 + n,
+            "phone": 500000000 + n,
+        }
+
+
+class PersonFactory(Factory):
+    model = Person
+    related = {"user": (UserFactory, {"user_type": User.UserType.PERSON})}
+
+    @classmethod
+    def defaults(cls, n):
+        return {
+            "name": f"Person {n}",
+            "vat": 10000000000 + n,
+            "phone": 500000000 + n,
+        }
+
+
+class ProductFactory(Factory):
+    model = Product
+
+    @classmethod
+    def defaults(cls, n):
+        return {
+            "name": f"Product {n}",
+            "description": f"Description of product {n}",
+            "category": Product.CategoryType.BOX,
+            "price": Decimal("10.00"),
+            "stock": 100,
+        }
+
+
+class OrderFactory(Factory):
+    model = Order
+    related = {"customer": (PersonFactory, {})}
+
+    @classmethod
+    def defaults(cls, n):
+        return {"total_amount": Decimal("0.00")}
+
+    @classmethod
+    def create_with_items(cls, size, products, quantity=1, **fields):
+        """Create ``size`` orders, each with one line per product."""
+        orders = cls.create_batch(size, **fields)
+
+        OrderItem.objects.bulk_create(
+            OrderItem(
+                order=order,
+                product=product,
+                quantity=quantity,
+                unit_price=product.price,
+                created_at=order.created_at,
+            )
+            for order in orders
+            for product in products
+        )
+
+        total = sum(product.price * quantity for product in products)
+        Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+            total_amount=total
+        )
+        for order in orders:
+            order.total_amount = total
+
+        return orders
+
+
+class OrderItemFactory(Factory):
+    model = OrderItem
+    related = {"order": (OrderFactory, {}), "product": (ProductFactory, {})}
+
+    @classmethod
+    def defaults(cls, n):
+        return {"quantity": 1, "unit_price": Decimal("10.00")}
+
+    @classmethod
+    def prepare(cls, instance):
+        # Items share their order's partition; see OrderItem.created_at.
+        if instance.order_id is not None:
+            instance.created_at = instance.order.created_at
+        return instance
@@ -0,0 +1,67 @@
+import gzip
+
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, override_settings
+
+from common.compression import GzipCompressor, compress
+from common.middleware import CompressionMiddleware
+from common.testing.cases import TestCase
+
+
+class GzipCompressorTests(TestCase):
+    def test_output_is_valid_gzip_with_random_padding(self):
+        data = b'{"name": "box"}' * 200
+        outputs = {compress(GzipCompressor, data) for _ in range(20)}
+
+        for output in outputs:
+            self.assertEqual(gzip.decompress(output), data)
+        self.assertGreater(len({len(output) for output in outputs}), 1)
+
+    def test_flushed_chunks_form_one_stream(self):
+        compressor = GzipCompressor()
+        output = b"".join(
+            compressor.compress(chunk) + compressor.flush()
+            for chunk in (b"first ", b"second ", b"third")
+        )
+        output += compressor.finish()
+
+        self.assertEqual(gzip.decompress(output), b"first second third")
+
+
+@override_settings(COMPRESSION_MIN_SIZE=10)
+class CompressionMiddlewareTests(TestCase):
+    body = b'{"products": []}' * 100
+
+    def process(self, response, accept_encoding="gzip, br"):
+        request = RequestFactory().get(
+            "/", headers={"Accept-Encoding": accept_encoding}
+        )
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_compresses_json_with_preferred_encoding(self):
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json")
+        )
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.body)
+
+    def test_leaves_html_uncompressed(self):
+        response = self.process(HttpResponse(self.body, content_type="text/html"))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, self.body)
+
+    def test_streams_gzip(self):
+        response = self.process(
+            StreamingHttpResponse(
+                [self.body, self.body], content_type="application/json"
+            ),
+            accept_encoding="gzip",
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(b"".join(response.streaming_content)), self.body * 2
+        )
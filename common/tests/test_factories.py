@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from access.models import User
+from common.testing.cases import TestCase
+from common.testing.factories import (
+    CompanyFactory,
+    OrderFactory,
+    PersonFactory,
+    ProductFactory,
+)
+from content.models import OrderItem, Person
+
+
+class ProfileFactoryTests(TestCase):
+    def test_create_batch_inserts_profiles_and_users_in_one_query_each(self):
+        with self.assertNumQueries(2):
+            people = PersonFactory.create_batch(3)
+
+        for person in Person.objects.select_related("user").filter(
+            pk__in=[person.pk for person in people]
+        ):
+            person.full_clean()
+            self.assertEqual(person.user.user_type, User.UserType.PERSON)
+
+    def test_company_users_are_company_type(self):
+        company = CompanyFactory.create()
+
+        company.full_clean()
+        self.assertEqual(company.user.user_type, User.UserType.COMPANY)
+
+
+class OrderFactoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.products = ProductFactory.create_batch(2)
+
+    def test_create_with_items_adds_a_line_per_product(self):
+        orders = OrderFactory.create_with_items(3, self.products, quantity=2)
+
+        self.assertEqual(OrderItem.objects.filter(order__in=orders).count(), 6)
+        for order in orders:
+            order.refresh_from_db()
+            self.assertEqual(order.total_amount, Decimal("40.00"))
+            self.assertIsInstance(order.customer, Person)
+
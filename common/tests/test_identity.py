@@ -0,0 +1,50 @@
+from common import identity
+from common.testing.cases import TestCase
+from common.testing.factories import ProductFactory
+from content.models import Product
+
+
+class IdentityMapTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = ProductFactory.create()
+
+    def get(self, **lookup):
+        return identity.get(Product.objects.all(), **lookup)
+
+    def test_lookups_share_one_instance_inside_the_map(self):
+        with identity.identity_map():
+            with self.assertNumQueries(1):
+                by_uuid = self.get(uuid=self.product.uuid)
+                self.assertIs(self.get(uuid=str(self.product.uuid)), by_uuid)
+                self.assertIs(self.get(pk=self.product.pk), by_uuid)
+                self.assertIs(self.get(id=self.product.pk), by_uuid)
+
+    def test_each_map_starts_empty(self):
+        with identity.identity_map():
+            first = self.get(uuid=self.product.uuid)
+
+        with identity.identity_map(), self.assertNumQueries(1):
+            self.assertIsNot(self.get(uuid=self.product.uuid), first)
+
+    def test_lookups_outside_a_map_query_every_time(self):
+        with self.assertNumQueries(2):
+            self.assertIsNot(
+                self.get(uuid=self.product.uuid), self.get(uuid=self.product.uuid)
+            )
+
+    def test_add_registers_pk_and_uuid(self):
+        with identity.identity_map():
+            identity.add(self.product)
+
+            with self.assertNumQueries(0):
+                self.assertIs(self.get(uuid=self.product.uuid), self.product)
+                self.assertIs(self.get(pk=self.product.pk), self.product)
+
+    def test_misses_are_not_remembered(self):
+        missing = "00000000-0000-0000-0000-000000000000"
+
+        with identity.identity_map(), self.assertNumQueries(2):
+            for _ in range(2):
+                with self.assertRaises(Product.DoesNotExist):
+                    self.get(uuid=missing)
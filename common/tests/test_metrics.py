@@ -0,0 +1,80 @@
+import json
+import os
+import shutil
+import tempfile
+
+from django.test import override_settings
+
+from common.metrics import COUNTER, GAUGE, Registry
+from common.testing.cases import TestCase
+
+
+class RegistryTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.registry = Registry(directory=self.directory)
+        self.registry.describe("requests_total", COUNTER, "Requests.")
+        self.registry.describe("pool_size", GAUGE, "Pool size.")
+
+    def write_worker(self, pid, samples):
+        with open(os.path.join(self.directory, f"metrics-{pid}.json"), "w") as fp:
+            json.dump(samples, fp)
+
+    def test_exited_workers_are_archived_without_gauges(self):
+        exited_pid = 2**22 + 1  # above the largest possible pid_max
+        self.write_worker(
+            exited_pid,
+            [["requests_total", [], 5], ["pool_size", [["alias", "default"]], 4]],
+        )
+        self.registry.inc("requests_total", value=2)
+
+        for _ in range(2):
+            samples = self.registry.collect()
+            self.assertEqual(samples[("requests_total", ())], 7)
+            self.assertNotIn(("pool_size", (("alias", "default"),)), samples)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.directory, f"metrics-{exited_pid}.json"))
+        )
+
+
+    def test_collectors_refresh_gauges_on_every_flush(self):
+        pool = {"size": 4}
+        self.registry.add_collector(
+            lambda: [("pool_size", pool["size"], {"alias": "default"})]
+        )
+        key = ("pool_size", (("alias", "default"),))
+
+        self.registry.flush()
+        pool["size"] = 2
+        self.registry.flush()
+
+        with open(os.path.join(self.directory, f"metrics-{os.getpid()}.json")) as fp:
+            self.assertIn(["pool_size", [["alias", "default"]], 2], json.load(fp))
+        self.assertEqual(self.registry.collect()[key], 2)
+
+
+class MetricsViewTests(TestCase):
+    def test_rejects_remote_scrapes(self):
+        response = self.client.get("/metrics", REMOTE_ADDR="203.0.113.7")
+        self.assertEqual(response.status_code, 403)
+
+    def test_requires_a_token_by_default(self):
+        response = self.client.get("/metrics", REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(METRICS_ALLOWED_IPS=["127.0.0.1"])
+    def test_allows_listed_addresses(self):
+        response = self.client.get("/metrics", REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_allows_bearer_token(self):
+        response = self.client.get(
+            "/metrics",
+            REMOTE_ADDR="203.0.113.7",
+            headers={"Authorization": "Bearer secret"},
+        )
+        self.assertEqual(response.status_code, 200)
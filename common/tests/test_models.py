@@ -0,0 +1,106 @@
+from django.contrib.auth.models import update_last_login
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from access.models import User
+from common.testing.cases import TestCase
+from common.testing.factories import OrderFactory, ProductFactory, UserFactory
+from content.models import Order
+
+
+class ValidateOnSaveTests(TestCase):
+    """``AbstractModel.save`` with ``validate_on_save``, through ``User``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other = UserFactory.create_batch(2)
+        # Stored before validation existed; untouched saves must not trip on it.
+        User.objects.filter(pk=cls.user.pk).update(email="legacy-login")
+
+    def load(self):
+        return User.objects.get(pk=self.user.pk)
+
+    def test_only_changed_fields_are_validated(self):
+        user = self.load()
+        user.name = "Renamed"
+        with self.assertNumQueries(3):  # SAVEPOINT, UPDATE, RELEASE
+            user.save()
+
+        user.user_type = "robot"
+        with self.assertRaises(ValidationError) as raised:
+            user.save()
+        self.assertEqual(list(raised.exception.message_dict), ["user_type"])
+
+    def test_update_fields_narrow_the_check(self):
+        user = self.load()
+        user.user_type = "robot"
+        user.is_active = False
+        with self.assertNumQueries(3):
+            user.save(update_fields=["is_active"])
+
+        user.refresh_from_db()
+        self.assertEqual(user.user_type, User.UserType.PERSON)
+        self.assertFalse(user.is_active)
+
+    def test_duplicate_email_raises_the_full_clean_error(self):
+        user = self.load()
+        user.email = self.other.email
+        with self.assertRaises(ValidationError) as expected:
+            user.validate_unique()
+
+        with self.assertRaises(ValidationError) as raised:
+            user.save()
+
+        self.assertEqual(raised.exception.message_dict, expected.exception.message_dict)
+        # The failed write was rolled back to a savepoint.
+        self.assertEqual(User.objects.filter(email=self.other.email).count(), 1)
+
+    def test_duplicate_email_on_create(self):
+        with self.assertRaises(ValidationError) as raised:
+            User(
+                email=self.other.email,
+                user_type=User.UserType.PERSON,
+                password=self.other.password,
+            ).save()
+
+        self.assertEqual(list(raised.exception.message_dict), ["email"])
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_update_last_login_is_a_single_update(self):
+        user = self.load()
+
+        with CaptureQueriesContext(connection) as queries:
+            update_last_login(None, user)
+
+        statements = [
+            query["sql"]
+            for query in queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+        ]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith("UPDATE"))
+
+
+class CoveringUniqueConstraintTests(TestCase):
+    """The uuid constraints hold on every database, covering or not."""
+
+    def assertDuplicateRejected(self, factory, instance, **fields):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            factory.create(uuid=instance.uuid, **fields)
+
+    def test_user_uuid_is_unique(self):
+        self.assertDuplicateRejected(UserFactory, UserFactory.create())
+
+    def test_product_uuid_is_unique(self):
+        self.assertDuplicateRejected(ProductFactory, ProductFactory.create())
+
+    def test_order_uuid_is_unique_with_created_at(self):
+        order, other = OrderFactory.create_batch(2)
+
+        # created_at is auto_now_add, so the clash is set up with an update.
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Order.objects.filter(pk=other.pk).update(
+                uuid=order.uuid, created_at=order.created_at
+            )
+        self.assertFalse(Order._meta.get_field("uuid").unique)
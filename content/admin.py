@@ -1,15 +1,71 @@
+import uuid
+
 from django.contrib import admin
-from .models import Product
+from common.admin import PerformanceModelAdmin
+from services.order import Service
+from .models import Order, OrderItem, Product
 
 # Register your models here.
 
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
-    search_fields = ["name", "category"]
+class ProductAdmin(PerformanceModelAdmin):
+    # Prefix search served by the index of 0010_product_search_index. Adding
+    # an unindexed field would OR it in and turn every search into a seq scan.
+    search_fields = ["^name"]
     readonly_fields = ["id", "uuid", "created_at", "updated_at"]
     list_display = [
         "name",
         "category",
+        "stock",
         "created_at",
     ]
+    list_filter = ["category"]
+
+
+@admin.register(Order)
+class OrderAdmin(PerformanceModelAdmin):
+    search_fields = ["uuid"]
+    # Status changes go through the service, which also releases stock.
+    readonly_fields = ["id", "uuid", "status", "created_at", "updated_at"]
+    list_display = ["uuid", "status", "total_amount", "created_at"]
+    list_filter = ["status"]
+    raw_id_fields = ["customer_content_type"]
+    actions = ["cancel_orders"]
+
+    @admin.action(description="Cancel selected orders and release their stock")
+    def cancel_orders(self, request, queryset):
+        orders = list(queryset.exclude(status=Order.Status.CANCELED))
+        for order in orders:
+            Service.cancel_order(order)
+
+        self.message_user(request, f"Canceled {len(orders)} orders.")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Matched as a UUID rather than text, so the uuid index is used.
+        if not search_term.strip():
+            return queryset, False
+        try:
+            value = uuid.UUID(search_term.strip())
+        except ValueError:
+            return queryset.none(), False
+        return queryset.filter(uuid=value), False
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(PerformanceModelAdmin):
+    readonly_fields = ["id", "uuid", "created_at", "updated_at"]
+    list_display = ["order", "product", "quantity", "unit_price", "created_at"]
+    list_select_related = ["order", "product"]
+    autocomplete_fields = ["order", "product"]
+
+    def get_readonly_fields(self, request, obj=None):
+        # Items stay in their order's partition; see OrderItem.created_at.
+        if obj is not None:
+            return [*self.readonly_fields, "order"]
+        return self.readonly_fields
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.created_at = obj.order.created_at
+        super().save_model(request, obj, form, change)
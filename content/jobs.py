@@ -0,0 +1,15 @@
+from django.core.mail import send_mail
+
+from jobs.registry import job
+from .models import Order
+
+
+@job
+def send_order_confirmation(order_id):
+    order = Order.objects.get(pk=order_id)
+    send_mail(
+        f"Order {order.uuid} received",
+        f"We received your order of {order.total_amount}.",
+        None,
+        [order.customer.user.email],
+    )
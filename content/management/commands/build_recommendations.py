@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from content import recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute frequently-bought-together products from confirmed orders. "
+        "Runs incrementally from the last saved state unless --full is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-k", type=int, default=10, help="Neighbours stored per product."
+        )
+        parser.add_argument(
+            "--full", action="store_true", help="Rebuild from all confirmed orders."
+        )
+
+    def handle(self, *args, **options):
+        updated = recommendations.build(top_k=options["top_k"], full=options["full"])
+        self.stdout.write(f"Updated recommendations for {updated} products")
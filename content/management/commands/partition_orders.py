@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from content.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    archive_table,
+    create_partitions,
+    detach_partition,
+    is_partitioned,
+    list_detached_partitions,
+    list_partitions,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly partitions of orders and order items, and "
+        "archive partitions older than the retention window to gzip files."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=3,
+            help="Number of future months to keep partitions for.",
+        )
+        parser.add_argument(
+            "--retain",
+            type=int,
+            default=None,
+            help="Archive partitions that ended more than this many months ago.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=settings.ORDER_ARCHIVE_DIR,
+            help="Directory the archived partitions are written to.",
+        )
+
+    def handle(self, *args, **options):
+        if not all(is_partitioned(table) for table in PARTITIONED_TABLES):
+            raise CommandError("Order tables are not partitioned on this database")
+
+        this_month = month_start(timezone.now())
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                for name in create_partitions(
+                    cursor,
+                    table,
+                    this_month,
+                    add_months(this_month, options["ahead"] + 1),
+                ):
+                    self.stdout.write(f"Created {name}")
+
+        if options["retain"] is None:
+            return
+
+        cutoff = add_months(this_month, -options["retain"])
+
+        # Children first, so archiving never leaves items without their order.
+        for table in reversed(PARTITIONED_TABLES):
+            with connection.cursor() as cursor:
+                partitions = list_partitions(cursor, table)
+
+            # Each detach commits on its own, so the slow dump below runs on
+            # standalone tables without holding locks on the order tables.
+            for name, month in sorted(partitions.items()):
+                if add_months(month, 1) <= cutoff:
+                    detach_partition(table, name)
+
+            with connection.cursor() as cursor:
+                detached = list_detached_partitions(cursor, table)
+
+            for name, month in sorted(detached.items()):
+                if add_months(month, 1) > cutoff:
+                    continue
+
+                with transaction.atomic(), connection.cursor() as cursor:
+                    path = archive_table(cursor, name, options["archive_dir"])
+                self.stdout.write(f"Archived {name} to {path}")
@@ -0,0 +1,52 @@
+import csv
+import sys
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from content.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Set product stock from a CSV file with uuid and stock columns. An "
+        "empty stock stops tracking the product, so it never runs out."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to read, or - for stdin.")
+
+    def handle(self, *args, **options):
+        if options["path"] == "-":
+            rows = list(csv.DictReader(sys.stdin))
+        else:
+            with open(options["path"], newline="") as file:
+                rows = list(csv.DictReader(file))
+
+        try:
+            stock = {
+                str(uuid.UUID(row["uuid"].strip())): (
+                    int(row["stock"]) if row["stock"].strip() else None
+                )
+                for row in rows
+            }
+        except (KeyError, ValueError) as error:
+            raise CommandError(f"Expected uuid and stock columns: {error}")
+
+        if any(value is not None and value < 0 for value in stock.values()):
+            raise CommandError("Stock cannot be negative")
+
+        with transaction.atomic():
+            products = list(
+                Product.objects.select_for_update().filter(uuid__in=stock)
+            )
+            missing = set(stock) - {str(product.uuid) for product in products}
+            if missing:
+                raise CommandError(f"Unknown products: {', '.join(sorted(missing))}")
+
+            for product in products:
+                product.stock = stock[str(product.uuid)]
+            Product.objects.bulk_update(products, ["stock"], batch_size=1000)
+
+        self.stdout.write(f"Updated stock of {len(products)} products")
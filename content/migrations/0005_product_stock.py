@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0004_alter_product_image'),
+    ]
+
+    # Existing products are added without a default so they keep selling
+    # (NULL, stock not tracked) until their stock is set; see
+    # ``manage.py set_stock``. New products start at 0.
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='stock',
+            field=models.PositiveIntegerField(blank=True, help_text='Units available for new orders; empty if stock is not tracked', null=True),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='stock',
+            field=models.PositiveIntegerField(blank=True, default=0, help_text='Units available for new orders; empty if stock is not tracked', null=True),
+        ),
+    ]
@@ -0,0 +1,154 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:38
+
+from django.core.management.color import no_style
+from django.db import migrations
+from django.utils import timezone
+
+from content.partitions import (
+    add_months,
+    create_partitions,
+    default_partition_name,
+    month_start,
+)
+
+
+# Indexes and constraints to rebuild on each partitioned table. Unique
+# constraints on a partitioned table must include the partition key.
+TABLE_SQL = {
+    "content_order": [
+        "CREATE UNIQUE INDEX content_order_uuid_created_at_uniq "
+        "ON content_order (uuid, created_at)",
+        "CREATE INDEX content_order_created_at_idx ON content_order (created_at)",
+        "CREATE INDEX content_order_customer_content_type_id_idx "
+        "ON content_order (customer_content_type_id)",
+        "ALTER TABLE content_order ADD CONSTRAINT content_order_customer_ct_fk "
+        "FOREIGN KEY (customer_content_type_id) REFERENCES django_content_type (id) "
+        "DEFERRABLE INITIALLY DEFERRED",
+    ],
+    "content_orderitem": [
+        "CREATE UNIQUE INDEX content_orderitem_uuid_created_at_uniq "
+        "ON content_orderitem (uuid, created_at)",
+        "CREATE UNIQUE INDEX content_orderitem_order_product_created_at_uniq "
+        "ON content_orderitem (order_id, product_id, created_at)",
+        "CREATE INDEX content_orderitem_order_id_idx ON content_orderitem (order_id)",
+        "CREATE INDEX content_orderitem_product_id_idx "
+        "ON content_orderitem (product_id)",
+        "ALTER TABLE content_orderitem ADD CONSTRAINT content_orderitem_product_fk "
+        "FOREIGN KEY (product_id) REFERENCES content_product (id) "
+        "DEFERRABLE INITIALLY DEFERRED",
+    ],
+}
+
+PARTITIONS_AHEAD = 3
+
+
+def partition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for table, statements in TABLE_SQL.items():
+            legacy = f"{table}_legacy"
+            sequence = f"{table}_id_seq"
+
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+            # Free the key and sequence names; ids are copied over as they are.
+            cursor.execute(
+                f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey"
+            )
+            cursor.execute(f"ALTER TABLE {legacy} ALTER COLUMN id DROP IDENTITY")
+            cursor.execute(
+                f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS "
+                f"INCLUDING CONSTRAINTS) PARTITION BY RANGE (created_at)"
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} "
+                f"ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)"
+            )
+
+            for statement in statements:
+                cursor.execute(statement)
+
+            cursor.execute(f"SELECT MIN(created_at) FROM {legacy}")
+            oldest = cursor.fetchone()[0] or timezone.now()
+            create_partitions(
+                cursor,
+                table,
+                month_start(oldest),
+                add_months(month_start(timezone.now()), PARTITIONS_AHEAD + 1),
+            )
+            cursor.execute(
+                f"CREATE TABLE {default_partition_name(table)} "
+                f"PARTITION OF {table} DEFAULT"
+            )
+
+            # Identity columns are not supported on partitioned tables before
+            # PostgreSQL 17, so ids come from a plain owned sequence. Set up
+            # before copying: the copy queues deferred foreign key checks,
+            # which block any later ALTER TABLE in this transaction.
+            cursor.execute(f"CREATE SEQUENCE {sequence} OWNED BY {table}.id")
+            cursor.execute(
+                f"ALTER TABLE {table} ALTER COLUMN id "
+                f"SET DEFAULT nextval('{sequence}')"
+            )
+
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+            cursor.execute(f"DROP TABLE {legacy} CASCADE")
+            cursor.execute(
+                f"SELECT setval('{sequence}', COALESCE(MAX(id), 0) + 1, false) "
+                f"FROM {table}"
+            )
+
+
+def unpartition_tables(apps, schema_editor):
+    """Copy the rows back into plain tables as Django creates them at 0006.
+
+    Runs in the migration's transaction, so a failure leaves the partitioned
+    tables untouched. Both directions rewrite every order row and hold an
+    exclusive lock while doing so; schedule them for a maintenance window
+    and take a ``pg_dump -t 'content_order*'`` first.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    models = [apps.get_model("content", name) for name in ("Order", "OrderItem")]
+    quote = schema_editor.quote_name
+
+    with schema_editor.connection.cursor() as cursor:
+        for model in models:
+            table = model._meta.db_table
+            partitioned = f"{table}_partitioned"
+
+            # Free the names the plain table's key and sequence are created with.
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+            cursor.execute(
+                f"ALTER TABLE {partitioned} "
+                f"RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey"
+            )
+            cursor.execute(
+                f"ALTER SEQUENCE {table}_id_seq RENAME TO {partitioned}_id_seq"
+            )
+
+            schema_editor.create_model(model)
+
+            columns = ", ".join(
+                quote(field.column) for field in model._meta.local_concrete_fields
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {partitioned}"
+            )
+            cursor.execute(f"DROP TABLE {partitioned} CASCADE")
+
+        for sql in schema_editor.connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_orderitem_order_no_db_constraint'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
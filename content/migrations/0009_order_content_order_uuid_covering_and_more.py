@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_relatedproduct'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['uuid'], include=('id',), name='content_order_uuid_covering'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['uuid'], include=('id',), name='content_product_uuid_covering'),
+        ),
+    ]
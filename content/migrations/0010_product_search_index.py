@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# The admin "^name" search filters on UPPER(name::text) LIKE 'TERM%', which
+# only an expression index with text_pattern_ops can serve on PostgreSQL.
+INDEXES = {
+    "content_product_name_prefix_idx": "name",
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON content_product ((UPPER({column}::text)) text_pattern_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('content', '0009_order_content_order_uuid_covering_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
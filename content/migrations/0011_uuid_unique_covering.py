@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:21
+
+import uuid
+from django.db import migrations, models
+
+
+def cover_order_uuid(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # Partitioned tables cannot enforce uuid alone; the (uuid, created_at)
+    # index from 0007 takes over as the covering one.
+    schema_editor.execute('DROP INDEX content_order_uuid_created_at_uniq')
+    schema_editor.execute(
+        'CREATE UNIQUE INDEX content_order_uuid_created_at_uniq '
+        'ON content_order (uuid, created_at) INCLUDE (id)'
+    )
+
+
+def uncover_order_uuid(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX content_order_uuid_created_at_uniq')
+    schema_editor.execute(
+        'CREATE UNIQUE INDEX content_order_uuid_created_at_uniq '
+        'ON content_order (uuid, created_at)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_product_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='content_product_uuid_covering',
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.UniqueConstraint(fields=('uuid',), include=('id',), name='content_product_uuid_uniq'),
+        ),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='content_order_uuid_covering',
+        ),
+        migrations.RunPython(cover_order_uuid, uncover_order_uuid),
+    ]
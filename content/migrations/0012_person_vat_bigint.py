@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:25
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0011_uuid_unique_covering'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='vat',
+            field=models.BigIntegerField(validators=[django.core.validators.RegexValidator(code='invalid_id', message='Personal ID must be exactly 11 digits', regex='^\\d{11}$')]),
+        ),
+    ]
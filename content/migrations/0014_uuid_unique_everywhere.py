@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:57
+
+import common.models
+import uuid
+from django.db import migrations, models
+
+
+def product_uuid_uniq():
+    return common.models.CoveringUniqueConstraint(
+        fields=('uuid',), include=('id',), name='content_product_uuid_uniq'
+    )
+
+
+def order_uuid_uniq():
+    return common.models.CoveringUniqueConstraint(
+        fields=('uuid', 'created_at'),
+        include=('id',),
+        name='content_order_uuid_created_at_uniq',
+    )
+
+
+def add_plain_uniques(apps, schema_editor):
+    # PostgreSQL already has both as covering indexes (0007, 0011); elsewhere
+    # the constraint with include was skipped, leaving uuid unchecked.
+    if schema_editor.connection.features.supports_covering_indexes:
+        return
+    schema_editor.add_constraint(apps.get_model('content', 'Product'), product_uuid_uniq())
+    schema_editor.add_constraint(apps.get_model('content', 'Order'), order_uuid_uniq())
+
+
+def remove_plain_uniques(apps, schema_editor):
+    if schema_editor.connection.features.supports_covering_indexes:
+        return
+    schema_editor.remove_constraint(apps.get_model('content', 'Order'), order_uuid_uniq())
+    schema_editor.remove_constraint(apps.get_model('content', 'Product'), product_uuid_uniq())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0013_orderitem_created_at_from_order'),
+    ]
+
+    operations = [
+        # Model state only: the partitioned tables never had a unique index
+        # on uuid alone, so the fields must not claim one.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name='product',
+                    name='content_product_uuid_uniq',
+                ),
+                migrations.AddConstraint(
+                    model_name='product',
+                    constraint=product_uuid_uniq(),
+                ),
+                migrations.AlterField(
+                    model_name='order',
+                    name='uuid',
+                    field=models.UUIDField(default=uuid.uuid4, editable=False),
+                ),
+                migrations.AlterField(
+                    model_name='orderitem',
+                    name='uuid',
+                    field=models.UUIDField(default=uuid.uuid4, editable=False),
+                ),
+                migrations.AddConstraint(
+                    model_name='order',
+                    constraint=order_uuid_uniq(),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_plain_uniques, remove_plain_uniques),
+            ],
+        ),
+    ]
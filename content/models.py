@@ -1,6 +1,11 @@
-from django.db import models
+import uuid
 
-from common.models import AbstractModel
+from django.db import models, transaction
+from django.utils import timezone
+
+from common.models import AbstractModel, CoveringUniqueConstraint
+from common.pubsub import notify
+from webhooks.outbox import publish
 from .validators import company_id_validator, person_id_validator
 
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -32,13 +37,21 @@ class Person(AbstractModel):
     )
 
     name = models.CharField(max_length=128, null=False)
-    vat = models.IntegerField(validators=[person_id_validator])
+    # Personal IDs have 11 digits, more than a 32-bit integer holds.
+    vat = models.BigIntegerField(validators=[person_id_validator])
     phone = models.IntegerField()
 
     class Meta:
         verbose_name_plural = "People"
 
 
+class ProductQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # Bulk updates bypass auto_now, but the catalog version relies on it.
+        kwargs.setdefault("updated_at", timezone.now())
+        return super().update(**kwargs)
+
+
 class Product(AbstractModel):
     class CategoryType(models.TextChoices):
         BOX = "box", "Box"
@@ -50,6 +63,24 @@ class Product(AbstractModel):
     category = models.CharField(max_length=12, choices=CategoryType.choices)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.ImageField(blank=True, null=True, upload_to="media/products/")
+    stock = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        default=0,
+        help_text="Units available for new orders; empty if stock is not tracked",
+    )
+    # Unique through the constraint below.
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta(AbstractModel.Meta):
+        constraints = [
+            # Covers id, so UUID to id resolution is an index-only scan.
+            CoveringUniqueConstraint(
+                fields=["uuid"], include=["id"], name="content_product_uuid_uniq"
+            ),
+        ]
 
 
 class Order(AbstractModel):
@@ -68,9 +99,68 @@ class Order(AbstractModel):
 
     total_amount = models.DecimalField(max_digits=10, decimal_places=2)
 
+    # On PostgreSQL the table is partitioned by created_at, so uuid can only
+    # be unique together with it; see the constraint below.
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
+
+    _loaded_status = None
+
+    class Meta(AbstractModel.Meta):
+        constraints = [
+            # Covers id, so UUID to id resolution is an index-only scan.
+            CoveringUniqueConstraint(
+                fields=["uuid", "created_at"],
+                include=["id"],
+                name="content_order_uuid_created_at_uniq",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    def save(self, *args, **kwargs):
+        status_changed = self._state.adding or self.status != self._loaded_status
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if status_changed:
+                self.publish_status()
+
+        self._loaded_status = self.status
+
+    def publish_status(self):
+        """Record the status change for webhooks and live order streams.
+
+        Both the outbox event and the notification are part of the current
+        transaction and only take effect once it commits.
+        """
+        customer_type = ContentType.objects.get_for_id(
+            self.customer_content_type_id
+        ).model
+        message = {
+            "order": str(self.uuid),
+            "status": self.status,
+            "customer_type": customer_type,
+            "customer_id": self.customer_object_id,
+        }
+
+        publish("order.status_changed", message)
+        notify(self.customer_topic(customer_type, self.customer_object_id), message)
+
+    @staticmethod
+    def customer_topic(customer_type, customer_id):
+        return f"orders:{customer_type}:{customer_id}"
+
 
 class OrderItem(AbstractModel):
-    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
+    # Partitioned tables can only be referenced through their full primary key
+    # (id, created_at), so the database-level constraint is dropped.
+    order = models.ForeignKey(
+        Order, on_delete=models.CASCADE, related_name="items", db_constraint=False
+    )
     product = models.ForeignKey(
         Product,
         on_delete=models.SET_NULL,
@@ -80,6 +170,11 @@ class OrderItem(AbstractModel):
     )
     quantity = models.IntegerField()
     unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+    # Set to the order's created_at: both tables are partitioned on it, and
+    # items must land in their order's partition. auto_now_add would ignore it.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    # Unique together with created_at, through an index on PostgreSQL (0007).
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
 
     class Meta:
         unique_together = [
@@ -88,3 +183,27 @@ class OrderItem(AbstractModel):
         ]
         verbose_name = "Order Item"
         verbose_name_plural = "Order Items"
+
+
+class RelatedProduct(models.Model):
+    """Precomputed "frequently bought together" neighbours of a product.
+
+    Rows are rebuilt offline by the ``build_recommendations`` command; serving
+    a product's list is a single read on the (product, rank) index.
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="related_products"
+    )
+    related = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="recommended_for"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField(help_text="Number of orders containing both products")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "rank"], name="unique_related_product_rank"
+            )
+        ]
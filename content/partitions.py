@@ -0,0 +1,204 @@
+import gzip
+import os
+from datetime import date
+
+from django.db import connection, transaction
+
+
+# Tables range-partitioned by month on created_at, parents before children.
+PARTITIONED_TABLES = ["content_order", "content_orderitem"]
+
+# How long a plain DETACH may wait for its lock before giving up.
+DETACH_LOCK_TIMEOUT = "5s"
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y%m}"
+
+
+def list_partitions(cursor, table):
+    """Return ``{partition_name: month}`` for the monthly partitions of ``table``."""
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        [table],
+    )
+    prefix = f"{table}_p"
+    partitions = {}
+
+    for (name,) in cursor.fetchall():
+        suffix = name[len(prefix) :]
+        if name.startswith(prefix) and len(suffix) == 6 and suffix.isdigit():
+            partitions[name] = date(int(suffix[:4]), int(suffix[4:]), 1)
+
+    return partitions
+
+
+def default_partition_name(table):
+    return f"{table}_default"
+
+
+def create_partitions(cursor, table, start, end):
+    """Create the missing monthly partitions of ``table`` covering [start, end).
+
+    Rows for a new month that already landed in the default partition are
+    moved into the new partition; PostgreSQL refuses to create a partition
+    whose range the default partition holds rows for.
+    """
+    existing = list_partitions(cursor, table)
+    default = default_partition_name(table)
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [default])
+    has_default = cursor.fetchone()[0]
+    created = []
+    month = month_start(start)
+
+    while month < end:
+        name = partition_name(table, month)
+        if name not in existing:
+            after = add_months(month, 1)
+            bounds = f"FROM ('{month.isoformat()}') TO ('{after.isoformat()}')"
+            in_range = (
+                f"created_at >= '{month.isoformat()}' "
+                f"AND created_at < '{after.isoformat()}'"
+            )
+
+            stranded = False
+            if has_default:
+                cursor.execute(f"SELECT 1 FROM {default} WHERE {in_range} LIMIT 1")
+                stranded = cursor.fetchone() is not None
+
+            if stranded:
+                # Attaching checks the default partition has no rows left in
+                # range, and builds the new partition's indexes.
+                cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+                cursor.execute(
+                    f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS "
+                    f"INCLUDING CONSTRAINTS)"
+                )
+                cursor.execute(
+                    f"WITH moved AS (DELETE FROM {default} WHERE {in_range} "
+                    f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+                )
+                cursor.execute(
+                    f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES {bounds}"
+                )
+            else:
+                cursor.execute(
+                    f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"
+                )
+            created.append(name)
+        month = add_months(month, 1)
+
+    return created
+
+
+def list_detached_partitions(cursor, table):
+    """Return ``{name: month}`` for monthly tables of ``table`` left detached.
+
+    A run that stops between detaching a partition and archiving it leaves
+    a standalone table behind; the next run picks it up from here.
+    """
+    cursor.execute(
+        """
+        SELECT relname FROM pg_class
+        WHERE relkind = 'r' AND relname LIKE %s
+          AND NOT EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = pg_class.oid)
+        """,
+        [f"{table}_p%"],
+    )
+    prefix = f"{table}_p"
+    tables = {}
+
+    for (name,) in cursor.fetchall():
+        suffix = name[len(prefix) :]
+        if len(suffix) == 6 and suffix.isdigit():
+            tables[name] = date(int(suffix[:4]), int(suffix[4:]), 1)
+
+    return tables
+
+
+def detach_partition(table, name):
+    """Detach partition ``name`` of ``table`` and commit straight away.
+
+    Must run outside a transaction. On PostgreSQL 14+ the partition is
+    detached CONCURRENTLY, which does not block queries on ``table``. That is
+    not possible while ``table`` has a default partition; a plain DETACH
+    then holds its exclusive lock only for the catalog update, and gives up
+    rather than queue every query on ``table`` behind a long-running one.
+    """
+    if connection.in_atomic_block:
+        raise RuntimeError("Partitions must be detached outside a transaction")
+
+    with connection.cursor() as cursor:
+        if connection.pg_version >= 140000:
+            cursor.execute(
+                "SELECT inhdetachpending FROM pg_inherits "
+                "WHERE inhrelid = to_regclass(%s)",
+                [name],
+            )
+            row = cursor.fetchone()
+            if row and row[0]:
+                # Left behind by an interrupted concurrent detach.
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name} FINALIZE")
+                return
+
+            cursor.execute(
+                "SELECT partdefid = 0 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(%s)",
+                [table],
+            )
+            if cursor.fetchone()[0]:
+                cursor.execute(
+                    f"ALTER TABLE {table} DETACH PARTITION {name} CONCURRENTLY"
+                )
+                return
+
+        with transaction.atomic():
+            cursor.execute(f"SET LOCAL lock_timeout = '{DETACH_LOCK_TIMEOUT}'")
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+
+
+def archive_table(cursor, name, directory):
+    """Dump a detached partition to ``<directory>/<name>.csv.gz`` and drop it."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.csv.gz")
+
+    copy_sql = f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)"
+    with gzip.open(path, "wb") as fp:
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            cursor.copy_expert(copy_sql, fp)
+        else:
+            with cursor.copy(copy_sql) as copy:
+                for data in copy:
+                    fp.write(data)
+
+    cursor.execute(f"DROP TABLE {name}")
+    return path
+
+
+def is_partitioned(table):
+    if connection.vendor != "postgresql":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table "
+            "JOIN pg_class ON pg_class.oid = partrelid WHERE relname = %s",
+            [table],
+        )
+        return cursor.fetchone() is not None
@@ -0,0 +1,227 @@
+import glob
+import json
+import os
+import uuid
+from array import array
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from webhooks.models import OutboxEvent
+from .models import Order, OrderItem, RelatedProduct
+
+
+# Each run saves a new matrix file; the state file names the current one.
+MATRIX_FILE = "cooccurrence-{}.npz"
+STATE_FILE = "state.json"
+
+STATUS_EVENT = "order.status_changed"
+
+
+def build(top_k=10, full=False, chunk_size=10000):
+    """Update co-occurrence counts and the stored top-k neighbours.
+
+    A full build streams every confirmed order. Otherwise only orders whose
+    confirmation is not yet marked as counted in the outbox are added to the
+    saved matrix, and only the products they touch are re-ranked. Events
+    are marked once the matrix counting them is saved, so a confirmation
+    that commits late, after events with higher ids were counted, is picked
+    up by the next run. Returns the number of products whose neighbours
+    were rewritten.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    state = None if full else _load_state()
+    matrix, consumed = state or (None, [])
+    # Finishes a run that stopped between saving its state and marking.
+    _mark_counted(consumed, chunk_size)
+
+    with _snapshot():
+        orders, products, consumed = _read_pairs(matrix is None, chunk_size)
+
+    orders = np.frombuffer(orders, dtype=np.int64)
+    products = np.frombuffer(products, dtype=np.int64)
+
+    size = int(products.max()) + 1 if len(products) else 0
+    if matrix is not None:
+        size = max(size, matrix.shape[0])
+
+    # Orders x products incidence matrix; X.T @ X counts orders per product pair.
+    _, order_rows = np.unique(orders, return_inverse=True)
+    incidence = sparse.csr_matrix(
+        (np.ones(len(products), dtype=np.float32), (order_rows, products)),
+        shape=(int(order_rows.max()) + 1 if len(orders) else 0, size),
+    )
+    counts = (incidence.T @ incidence).tocsr()
+    counts.setdiag(0)
+    counts.eliminate_zeros()
+
+    if matrix is not None:
+        matrix.resize((size, size))
+        counts = (matrix + counts).tocsr()
+
+    if state is None:
+        rows = np.flatnonzero(np.diff(counts.indptr))
+    else:
+        rows = np.unique(products)
+
+    _store_neighbours(counts, rows, top_k, replace_all=state is None)
+    name = _save_state(counts, consumed)
+    _mark_counted(consumed, chunk_size)
+    _write_state(name, [])
+
+    return len(rows)
+
+
+@contextmanager
+def _snapshot():
+    """Run the enclosed reads against one consistent view of the database.
+
+    On PostgreSQL the outbox events and the order scan would otherwise see
+    different commits: an order confirmed between the two is counted by a
+    full build, and again by the next run through its unmarked event.
+    """
+    snapshot = connection.vendor == "postgresql" and not connection.in_atomic_block
+    with transaction.atomic():
+        if snapshot:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"
+                )
+        yield
+
+
+def _read_pairs(full, chunk_size):
+    """Return (order ids, product ids, consumed event ids) of the items to count.
+
+    Every status event not yet counted is consumed. A full build reads the
+    items of every confirmed order; otherwise only those of the orders the
+    consumed events confirm.
+    """
+    events = OutboxEvent.objects.filter(
+        event_type=STATUS_EVENT, counted_at__isnull=True
+    ).values_list("id", "payload__status", "payload__order")
+
+    consumed, uuids = [], []
+    for event_id, status, order_uuid in events.iterator(chunk_size=chunk_size):
+        consumed.append(event_id)
+        if status == Order.Status.CONFIRMED:
+            uuids.append(order_uuid)
+
+    if full:
+        items = OrderItem.objects.filter(order__status=Order.Status.CONFIRMED)
+    else:
+        items = OrderItem.objects.filter(order__uuid__in=uuids)
+
+    orders, products = array("q"), array("q")
+    pairs = (
+        items.filter(product__isnull=False)
+        .values_list("order_id", "product_id")
+        .iterator(chunk_size=chunk_size)
+    )
+    for order_id, product_id in pairs:
+        orders.append(order_id)
+        products.append(product_id)
+
+    return orders, products, consumed
+
+
+def _mark_counted(consumed, chunk_size):
+    now = timezone.now()
+    for start in range(0, len(consumed), chunk_size):
+        OutboxEvent.objects.filter(
+            id__in=consumed[start : start + chunk_size], counted_at__isnull=True
+        ).update(counted_at=now)
+
+
+def _store_neighbours(counts, rows, top_k, replace_all):
+    import numpy as np
+
+    neighbours = []
+    for row in rows:
+        start, end = counts.indptr[row], counts.indptr[row + 1]
+        if start == end:
+            continue
+
+        scores = counts.data[start:end]
+        columns = counts.indices[start:end]
+        best = np.argsort(-scores, kind="stable")[:top_k]
+
+        neighbours.extend(
+            RelatedProduct(
+                product_id=int(row),
+                related_id=int(columns[index]),
+                rank=rank,
+                score=float(scores[index]),
+            )
+            for rank, index in enumerate(best)
+        )
+
+    with transaction.atomic():
+        stale = RelatedProduct.objects.all()
+        if not replace_all:
+            stale = stale.filter(product_id__in=[int(row) for row in rows])
+
+        stale.delete()
+        RelatedProduct.objects.bulk_create(neighbours, batch_size=1000)
+
+
+def _load_state():
+    from scipy import sparse
+
+    directory = settings.RECOMMENDATIONS_DIR
+    try:
+        with open(os.path.join(directory, STATE_FILE)) as fp:
+            state = json.load(fp)
+        # States saved before matrices were versioned use a fixed name.
+        name = state.get("matrix", "cooccurrence.npz")
+        matrix = sparse.load_npz(os.path.join(directory, name)).tocsr()
+    except (OSError, ValueError):
+        return None
+
+    if "watermark" in state:
+        # Saved before events were marked: everything up to it was counted.
+        OutboxEvent.objects.filter(
+            id__lte=state["watermark"],
+            event_type=STATUS_EVENT,
+            counted_at__isnull=True,
+        ).update(counted_at=timezone.now())
+        return matrix, []
+
+    if "consumed" not in state:
+        return None
+
+    return matrix, state["consumed"]
+
+
+def _save_state(matrix, consumed):
+    """Save ``matrix`` under a new name and switch the state file to it."""
+    from scipy import sparse
+
+    directory = settings.RECOMMENDATIONS_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    name = MATRIX_FILE.format(uuid.uuid4().hex)
+    sparse.save_npz(os.path.join(directory, name), matrix)
+    _write_state(name, consumed)
+
+    for path in glob.glob(os.path.join(directory, "cooccurrence*.npz")):
+        if os.path.basename(path) != name:
+            os.remove(path)
+
+    return name
+
+
+def _write_state(name, consumed):
+    """Atomically point the state at matrix ``name``.
+
+    ``consumed`` lists the events counted into that matrix that may not be
+    marked in the outbox yet.
+    """
+    path = os.path.join(settings.RECOMMENDATIONS_DIR, STATE_FILE)
+    with open(f"{path}.tmp", "w") as fp:
+        json.dump({"matrix": name, "consumed": consumed}, fp)
+    os.replace(f"{path}.tmp", path)
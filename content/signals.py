@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from access.models import User, profile_cache
+from .models import Company, Person
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Person)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    cache = profile_cache()
+    if cache is not None:
+        cache.delete(User.profile_cache_key(instance.user_id))
@@ -0,0 +1,93 @@
+import unittest
+
+from django.db import connection
+from django.urls import reverse
+
+from common.testing.cases import TestCase
+from common.testing.factories import (
+    CompanyFactory,
+    OrderFactory,
+    ProductFactory,
+    UserFactory,
+)
+from content.models import Order, Product
+
+
+class ProductAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserFactory.create(is_admin=True)
+        cls.box = ProductFactory.create(name="Blue box")
+        cls.paper = ProductFactory.create(
+            name="Wrapping paper", category=Product.CategoryType.PAPER
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.admin)
+
+    def changelist(self, **params):
+        response = self.client.get(reverse("admin:content_product_changelist"), params)
+        return response.context["cl"]
+
+    def test_search_is_a_name_prefix(self):
+        self.assertEqual(list(self.changelist(q="blu").result_list), [self.box])
+        self.assertEqual(list(self.changelist(q="box").result_list), [])
+        self.assertEqual(list(self.changelist(q="paper").result_list), [])
+
+    def test_filter_by_category(self):
+        changelist = self.changelist(category=Product.CategoryType.PAPER)
+
+        self.assertEqual(list(changelist.result_list), [self.paper])
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "PostgreSQL plans")
+    def test_search_uses_the_prefix_index(self):
+        queryset = self.changelist(q="blu").queryset
+
+        with connection.cursor() as cursor:
+            # Too few rows for the planner to prefer the index on its own.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("content_product_name_prefix_idx", plan)
+
+
+class OrderAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = UserFactory.create(is_admin=True)
+        cls.order, _ = OrderFactory.create_batch(2, customer=CompanyFactory.create())
+
+    def test_cancel_action_releases_stock(self):
+        product = ProductFactory.create(stock=5)
+        order = OrderFactory.create_with_items(
+            1, [product], quantity=2, customer=CompanyFactory.create()
+        )[0]
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse("admin:content_order_changelist"),
+            {"action": "cancel_orders", "_selected_action": [order.pk]},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        order.refresh_from_db()
+        product.refresh_from_db()
+        self.assertEqual(order.status, Order.Status.CANCELED)
+        self.assertEqual(product.stock, 7)
+
+    def test_status_is_read_only(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("admin:content_order_change", args=[self.order.pk])
+        )
+
+        self.assertNotIn("status", response.context["adminform"].form.fields)
+
+    def test_search_by_uuid(self):
+        self.client.force_login(self.admin)
+        url = reverse("admin:content_order_changelist")
+
+        for term, expected in [(str(self.order.uuid), [self.order]), ("junk", [])]:
+            response = self.client.get(url, {"q": term})
+            self.assertEqual(list(response.context["cl"].result_list), expected)
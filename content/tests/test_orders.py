@@ -0,0 +1,38 @@
+from common.testing.cases import TestCase
+from common.testing.factories import (
+    CompanyFactory,
+    OrderFactory,
+    OrderItemFactory,
+    ProductFactory,
+)
+from services.order import Service
+
+
+class OrderItemCreatedAtTests(TestCase):
+    """Items take their order's created_at, so both share a partition."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CompanyFactory.create()
+        cls.products = ProductFactory.create_batch(2)
+
+    def assertItemsMatchOrder(self, order):
+        self.assertEqual(
+            set(order.items.values_list("created_at", flat=True)), {order.created_at}
+        )
+
+    def test_create_order(self):
+        order = Service.create_order(
+            self.customer, [(product, 1) for product in self.products]
+        )
+
+        self.assertItemsMatchOrder(order)
+
+    def test_factories(self):
+        order, other = OrderFactory.create_with_items(
+            2, self.products, customer=self.customer
+        )
+        OrderItemFactory.create(order=other, product=None)
+
+        self.assertItemsMatchOrder(order)
+        self.assertItemsMatchOrder(other)
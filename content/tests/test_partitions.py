@@ -0,0 +1,115 @@
+import csv
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+
+from django.core.management import call_command
+from django.db import connection
+
+from common.testing.cases import TestCase, TransactionTestCase
+from common.testing.factories import CompanyFactory, OrderFactory, ProductFactory
+from content.models import Order, OrderItem
+from content.partitions import (
+    PARTITIONED_TABLES,
+    create_partitions,
+    default_partition_name,
+    detach_partition,
+    is_partitioned,
+    list_detached_partitions,
+    list_partitions,
+    partition_name,
+)
+
+
+class CreatePartitionsTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not is_partitioned("content_order"):
+            raise unittest.SkipTest("needs partitioned order tables")
+        super().setUpClass()
+
+    def test_moves_rows_out_of_the_default_partition(self):
+        order = OrderFactory.create(customer=CompanyFactory.create())
+        # Far beyond the partitions the migration creates.
+        Order.objects.filter(pk=order.pk).update(
+            created_at=datetime(2090, 5, 2, tzinfo=timezone.utc)
+        )
+
+        with connection.cursor() as cursor:
+            created = create_partitions(
+                cursor, "content_order", date(2090, 5, 1), date(2090, 6, 1)
+            )
+            name = partition_name("content_order", date(2090, 5, 1))
+            self.assertEqual(created, [name])
+
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM content_order WHERE id = %s",
+                [order.pk],
+            )
+            self.assertEqual(cursor.fetchone()[0], name)
+            cursor.execute(
+                f"SELECT count(*) FROM {default_partition_name('content_order')}"
+            )
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+
+class ArchivePartitionsTests(TransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not is_partitioned("content_order"):
+            raise unittest.SkipTest("needs partitioned order tables")
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_archives_expired_partitions_and_leftover_detached_ones(self):
+        with connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                create_partitions(cursor, table, date(2000, 1, 1), date(2000, 3, 1))
+
+        orders = OrderFactory.create_with_items(
+            2, [ProductFactory.create()], customer=CompanyFactory.create()
+        )
+        for order, day in zip(orders, [date(2000, 1, 15), date(2000, 2, 15)]):
+            created_at = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+            Order.objects.filter(pk=order.pk).update(created_at=created_at)
+            OrderItem.objects.filter(order_id=order.pk).update(created_at=created_at)
+
+        # As if an earlier run stopped after detaching this one.
+        detach_partition(
+            "content_orderitem", partition_name("content_orderitem", date(2000, 2, 1))
+        )
+
+        call_command(
+            "partition_orders",
+            retain=1,
+            archive_dir=self.directory,
+            stdout=io.StringIO(),
+        )
+
+        self.assertFalse(Order.objects.filter(pk__in=[o.pk for o in orders]).exists())
+        with connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                self.assertEqual(list_detached_partitions(cursor, table), {})
+                oldest = min(list_partitions(cursor, table).values())
+                self.assertGreater(oldest, date(2000, 2, 1))
+
+        path = os.path.join(self.directory, "content_order_p200001.csv.gz")
+        with gzip.open(path, "rt", newline="") as fp:
+            rows = list(csv.DictReader(fp))
+        self.assertEqual([row["uuid"] for row in rows], [str(orders[0].uuid)])
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted(
+                f"{partition_name(table, month)}.csv.gz"
+                for table in PARTITIONED_TABLES
+                for month in (date(2000, 1, 1), date(2000, 2, 1))
+            ),
+        )
@@ -0,0 +1,11 @@
+from common.testing.cases import TestCase
+from common.testing.factories import PersonFactory
+
+
+class PersonTests(TestCase):
+    def test_vat_holds_eleven_digit_ids(self):
+        person = PersonFactory.create(vat=99999999999)
+
+        person.refresh_from_db()
+        person.full_clean()
+        self.assertEqual(person.vat, 99999999999)
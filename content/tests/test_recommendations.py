@@ -0,0 +1,101 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+
+from common.testing.cases import TestCase, TransactionTestCase
+from common.testing.factories import CompanyFactory, OrderFactory, ProductFactory
+from content import recommendations
+from content.models import Order, RelatedProduct
+from webhooks.models import OutboxEvent
+
+
+class BuildTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CompanyFactory.create()
+        cls.a, cls.b, cls.c = ProductFactory.create_batch(3)
+        OrderFactory.create_with_items(
+            2, [cls.a, cls.b], customer=cls.customer, status=Order.Status.CONFIRMED
+        )
+        OrderFactory.create_with_items(
+            1, [cls.a, cls.c], customer=cls.customer, status=Order.Status.CONFIRMED
+        )
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(RECOMMENDATIONS_DIR=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def related(self, product):
+        return list(
+            RelatedProduct.objects.filter(product=product)
+            .order_by("rank")
+            .values_list("related_id", "score")
+        )
+
+    def test_full_then_incremental(self):
+        self.assertEqual(recommendations.build(), 3)
+        self.assertEqual(self.related(self.a), [(self.b.pk, 2.0), (self.c.pk, 1.0)])
+
+        order = OrderFactory.create_with_items(
+            1, [self.a, self.c], customer=self.customer
+        )[0]
+        order.status = Order.Status.CONFIRMED
+        order.save()  # Records the confirmation in the outbox.
+
+        self.assertEqual(recommendations.build(), 2)
+        self.assertEqual(self.related(self.a), [(self.b.pk, 2.0), (self.c.pk, 2.0)])
+        self.assertEqual(self.related(self.c), [(self.a.pk, 2.0)])
+
+    def confirm(self, products, event_id=None):
+        order = OrderFactory.create_with_items(1, products, customer=self.customer)[0]
+        Order.objects.filter(pk=order.pk).update(status=Order.Status.CONFIRMED)
+        return OutboxEvent.objects.create(
+            id=event_id,
+            event_type=recommendations.STATUS_EVENT,
+            payload={"order": str(order.uuid), "status": Order.Status.CONFIRMED},
+        )
+
+    def test_confirmation_committed_after_a_higher_id_is_counted(self):
+        # Taken by a transaction that commits after the next run.
+        late_id = OutboxEvent.objects.create(event_type="reserved", payload={}).pk
+        OutboxEvent.objects.filter(pk=late_id).delete()
+        recommendations.build()
+
+        self.confirm([self.b, self.c])
+        recommendations.build()
+        self.confirm([self.b, self.c], event_id=late_id)
+        recommendations.build()
+
+        self.assertEqual(self.related(self.c), [(self.b.pk, 2.0), (self.a.pk, 1.0)])
+        self.assertFalse(OutboxEvent.objects.filter(counted_at__isnull=True).exists())
+
+    def test_run_stopped_before_marking_is_not_counted_twice(self):
+        recommendations.build()
+        self.confirm([self.b, self.c])
+
+        with mock.patch.object(
+            recommendations, "_mark_counted", side_effect=[None, RuntimeError]
+        ):
+            with self.assertRaises(RuntimeError):
+                recommendations.build()
+        recommendations.build()
+
+        self.assertEqual(self.related(self.c), [(self.a.pk, 1.0), (self.b.pk, 1.0)])
+        self.assertFalse(OutboxEvent.objects.filter(counted_at__isnull=True).exists())
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "PostgreSQL snapshots")
+class SnapshotTests(TransactionTestCase):
+    def test_reads_share_one_snapshot(self):
+        with recommendations._snapshot(), connection.cursor() as cursor:
+            cursor.execute("SHOW transaction_isolation")
+            self.assertEqual(cursor.fetchone()[0], "repeatable read")
+            cursor.execute("SHOW transaction_read_only")
+            self.assertEqual(cursor.fetchone()[0], "on")
@@ -0,0 +1,138 @@
+import itertools
+import queue
+import random
+import sys
+import threading
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import OperationalError, connection, connections
+
+from common.testing.cases import TestCase, TransactionTestCase
+from common.testing.factories import CompanyFactory, ProductFactory
+from content.models import Order, OrderItem
+from services.order import Service
+
+
+class ReserveStockTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = ProductFactory.create(stock=3)
+        cls.untracked = ProductFactory.create(stock=None)
+
+    def test_reserves_and_rejects_short_lines_by_uuid(self):
+        Service.reserve_stock([(self.product, 2)])
+
+        with self.assertRaises(ValidationError) as raised:
+            Service.reserve_stock([(self.product, 2), (self.untracked, 1)])
+
+        self.assertEqual(raised.exception.code, "out_of_stock")
+        self.assertIn(str(self.product.uuid), raised.exception.message)
+        self.assertNotIn(str(self.untracked.uuid), raised.exception.message)
+
+    def test_untracked_stock_never_runs_out(self):
+        Service.reserve_stock([(self.untracked, 1000)])
+
+        self.untracked.refresh_from_db()
+        self.assertIsNone(self.untracked.stock)
+
+
+class ConcurrentCheckoutTests(TransactionTestCase):
+    """Hundreds of simultaneous checkouts of the same two hot products.
+
+    Each worker thread runs ``Service.create_order`` on its own connection.
+    SQLite locks the whole database and reports contention as "locked"
+    errors right away; those checkouts are retried, as a client would.
+    """
+
+    checkouts = 300
+    quantity = 3
+    stock = 450
+
+    def test_hot_products_never_oversold(self):
+        customer = CompanyFactory.create()
+        hot, other = ProductFactory.create_batch(2, stock=self.stock)
+        # Half the baskets list the products in reverse to provoke deadlocks.
+        baskets = [
+            [(hot, self.quantity), (other, 1)][:: 1 if n % 2 else -1]
+            for n in range(self.checkouts)
+        ]
+        workers = min(self.checkouts, self._free_connections())
+
+        results, elapsed = self._run_concurrently(customer, baskets, workers)
+        sys.stderr.write(
+            f"\n{self.checkouts} checkouts, {workers} at a time: {elapsed:.2f}s, "
+            f"{self.checkouts / elapsed:.0f} checkouts/s\n"
+        )
+
+        reserved = results.count("reserved")
+        self.assertEqual(results.count("out_of_stock"), self.checkouts - reserved)
+        self.assertEqual(reserved, self.stock // self.quantity)
+        self.assertEqual(Order.objects.count(), reserved)
+        self.assertEqual(OrderItem.objects.count(), 2 * reserved)
+
+        hot.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(hot.stock, self.stock - reserved * self.quantity)
+        self.assertEqual(other.stock, self.stock - reserved)
+
+    def _free_connections(self):
+        if connection.vendor != "postgresql":
+            return self.checkouts
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('max_connections')::int - count(*) "
+                "FROM pg_stat_activity"
+            )
+            # Leave room for superuser slots and other clients.
+            return cursor.fetchone()[0] - 10
+
+    def _run_concurrently(self, customer, baskets, workers):
+        pending = queue.SimpleQueue()
+        for n in range(len(baskets)):
+            pending.put(n)
+        started = []
+        # Timed from when every worker is connected and ready.
+        barrier = threading.Barrier(
+            workers, action=lambda: started.append(time.perf_counter())
+        )
+        results = [None] * len(baskets)
+
+        deadline = time.monotonic() + 120
+
+        def checkout(basket):
+            for attempt in itertools.count():
+                try:
+                    Service.create_order(customer, basket)
+                    return "reserved"
+                except ValidationError as error:
+                    return error.code
+                except OperationalError as error:
+                    if "locked" not in str(error) or time.monotonic() > deadline:
+                        raise
+                    time.sleep(random.uniform(0, min(0.2, 0.001 * 2**attempt)))
+
+        def work():
+            try:
+                connection.ensure_connection()
+                barrier.wait()
+                while True:
+                    try:
+                        n = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        results[n] = checkout(baskets[n])
+                    except Exception as error:
+                        results[n] = repr(error)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=work) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, time.perf_counter() - started[0]
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency", type=int, default=4, help="Jobs run in parallel."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10, help="Jobs claimed per poll."
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the queue is empty.",
+        )
+        parser.add_argument(
+            "--retry-delay",
+            type=float,
+            default=10.0,
+            help="Seconds before the first retry; doubles on every attempt.",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Process one batch and exit."
+        )
+
+    def handle(self, *args, **options):
+        Worker(
+            concurrency=options["concurrency"],
+            batch_size=options["batch_size"],
+            poll_interval=options["poll_interval"],
+            retry_delay=timedelta(seconds=options["retry_delay"]),
+        ).run(once=options["once"])
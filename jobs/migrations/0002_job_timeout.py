@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='timeout',
+            field=models.DurationField(blank=True, help_text="Time a run may take before it is presumed lost; the worker's lock timeout if empty", null=True),
+        ),
+    ]
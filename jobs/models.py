@@ -0,0 +1,47 @@
+from django.db import models
+
+from common.models import AbstractModel
+
+
+class Job(AbstractModel):
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    name = models.CharField(max_length=255, help_text="Dotted path of the job function")
+    payload = models.JSONField(default=dict)
+
+    status = models.CharField(
+        max_length=12, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    timeout = models.DurationField(
+        blank=True,
+        null=True,
+        help_text="Time a run may take before it is presumed lost; "
+        "the worker's lock timeout if empty",
+    )
+
+    run_at = models.DateTimeField()
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["run_at"],
+                condition=models.Q(status="queued"),
+                name="job_queued_run_at_idx",
+            ),
+            models.Index(
+                fields=["locked_at"],
+                condition=models.Q(status="running"),
+                name="job_running_locked_at_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import Job
+
+
+class JobFunction:
+    """A function that can run inline or be queued for the background worker."""
+
+    def __init__(self, func, max_attempts, timeout):
+        self.func = func
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.__doc__ = func.__doc__
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, delay=None, **kwargs):
+        """Queue the job; the row commits or rolls back with the caller's transaction."""
+        return Job.objects.create(
+            name=self.name,
+            payload=kwargs,
+            max_attempts=self.max_attempts,
+            timeout=self.timeout,
+            run_at=timezone.now() + (delay or timedelta()),
+        )
+
+
+def job(func=None, *, max_attempts=3, timeout=None):
+    """Register a function as a background job; arguments must be JSON-serializable.
+
+    ``timeout`` is how long a run may take before the worker presumes it lost
+    and runs the job again; it defaults to the worker's ``lock_timeout``.
+    """
+
+    def decorator(func):
+        return JobFunction(func, max_attempts, timeout)
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from common.testing.cases import TestCase
+from jobs.models import Job
+from jobs.registry import job
+from jobs.worker import Worker
+
+
+@job(timeout=timedelta(minutes=1))
+def quick():
+    pass
+
+
+class RequeueStaleTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.worker = Worker(lock_timeout=timedelta(minutes=10))
+
+    def running(self, locked_ago, **fields):
+        now = timezone.now()
+        return Job.objects.create(
+            name="jobs.tests.test_worker.quick",
+            status=Job.Status.RUNNING,
+            run_at=now,
+            locked_at=now - locked_ago,
+            **fields,
+        )
+
+    def test_requeue_counts_an_attempt(self):
+        lost = self.running(timedelta(minutes=11))
+
+        self.worker.requeue_stale()
+
+        lost.refresh_from_db()
+        self.assertEqual(lost.status, Job.Status.QUEUED)
+        self.assertEqual(lost.attempts, 1)
+        self.assertIsNone(lost.locked_at)
+
+    def test_fails_once_attempts_run_out(self):
+        lost = self.running(timedelta(minutes=11), attempts=2, max_attempts=3)
+
+        self.worker.requeue_stale()
+
+        lost.refresh_from_db()
+        self.assertEqual(lost.status, Job.Status.FAILED)
+        self.assertEqual(lost.attempts, 3)
+
+    def test_per_job_timeout(self):
+        short = self.running(timedelta(minutes=2), timeout=quick.timeout)
+        default = self.running(timedelta(minutes=2))
+
+        self.worker.requeue_stale()
+
+        short.refresh_from_db()
+        default.refresh_from_db()
+        self.assertEqual(short.status, Job.Status.QUEUED)
+        self.assertEqual(default.status, Job.Status.RUNNING)
+
+    def test_enqueue_stores_timeout(self):
+        self.assertEqual(quick.enqueue().timeout, timedelta(minutes=1))
+
+
+class ClaimTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.worker = Worker(lock_timeout=timedelta(minutes=10))
+        self.job = quick.enqueue()
+
+    def reclaim(self, job):
+        """Let the run overrun its timeout and hand the job to another worker."""
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=job.locked_at - timedelta(minutes=2), run_at=timezone.now()
+        )
+        self.worker.requeue_stale()
+        (newer,) = self.worker.claim()
+        return newer
+
+    def test_claim_stamps_the_run(self):
+        (job,) = self.worker.claim()
+
+        self.assertEqual(job.status, Job.Status.RUNNING)
+        self.assertEqual(job.locked_at, Job.objects.get(pk=job.pk).locked_at)
+
+    def test_complete(self):
+        (job,) = self.worker.claim()
+
+        self.worker.complete(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNone(job.locked_at)
+
+    def test_overrun_completion_leaves_the_newer_run_alone(self):
+        (job,) = self.worker.claim()
+        newer = self.reclaim(job)
+
+        with self.assertLogs("jobs.worker", "WARNING"):
+            self.worker.complete(job)
+
+        current = Job.objects.get(pk=job.pk)
+        self.assertEqual(current.status, Job.Status.RUNNING)
+        self.assertEqual(current.locked_at, newer.locked_at)
+        self.assertEqual(current.attempts, 1)
+
+        self.worker.complete(newer)
+        current.refresh_from_db()
+        self.assertEqual(current.status, Job.Status.DONE)
+        self.assertEqual(current.attempts, 2)
+
+    def test_overrun_failure_leaves_the_newer_run_alone(self):
+        (job,) = self.worker.claim()
+        newer = self.reclaim(job)
+
+        with self.assertLogs("jobs.worker", "WARNING"):
+            self.worker.fail(job, "boom")
+
+        current = Job.objects.get(pk=job.pk)
+        self.assertEqual(current.status, Job.Status.RUNNING)
+        self.assertEqual(current.locked_at, newer.locked_at)
+        self.assertEqual(current.last_error, "Run did not finish within its timeout")
@@ -0,0 +1,160 @@
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import DurationField, F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """Poll the job table and run due jobs on a pool of threads.
+
+    Jobs are claimed in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so any number of workers can poll the same table without handing out a
+    job twice. Failed jobs are retried with exponential backoff until
+    ``max_attempts`` is reached. A run only records its outcome while it
+    still holds its claim, so one that overran and was handed to another
+    worker can't overwrite the newer run.
+    """
+
+    def __init__(
+        self,
+        concurrency=4,
+        batch_size=10,
+        poll_interval=1.0,
+        retry_delay=timedelta(seconds=10),
+        lock_timeout=timedelta(minutes=10),
+    ):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.lock_timeout = lock_timeout
+
+    def run(self, once=False):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                self.requeue_stale()
+                jobs = self.claim()
+
+                # Consume the results so exceptions in bookkeeping surface here.
+                list(executor.map(self.execute, jobs))
+
+                if once:
+                    return
+                if not jobs:
+                    time.sleep(self.poll_interval)
+
+    def claim(self):
+        now = timezone.now()
+
+        with transaction.atomic():
+            jobs = list(
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(status=Job.Status.QUEUED, run_at__lte=now)
+                .order_by("run_at")[: self.batch_size]
+            )
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.Status.RUNNING, locked_at=now, updated_at=now
+            )
+
+        # The claim time identifies this run; completion checks it is still ours.
+        for job in jobs:
+            job.status = Job.Status.RUNNING
+            job.locked_at = now
+
+        return jobs
+
+    def claimed(self, job):
+        return Job.objects.filter(
+            pk=job.pk, status=Job.Status.RUNNING, locked_at=job.locked_at
+        )
+
+    def execute(self, job):
+        try:
+            import_string(job.name)(**job.payload)
+        except Exception:
+            logger.exception("Job %s (%s) failed", job.pk, job.name)
+            self.fail(job, traceback.format_exc())
+        else:
+            self.complete(job)
+        finally:
+            # Each worker thread holds its own connection; don't leak them.
+            connection.close()
+
+    def complete(self, job):
+        updated = self.claimed(job).update(
+            status=Job.Status.DONE,
+            attempts=job.attempts + 1,
+            locked_at=None,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            self.lost(job)
+
+    def fail(self, job, error):
+        attempts = job.attempts + 1
+        now = timezone.now()
+
+        if attempts < job.max_attempts:
+            status = Job.Status.QUEUED
+            run_at = now + self.retry_delay * 2 ** (attempts - 1)
+        else:
+            status = Job.Status.FAILED
+            run_at = job.run_at
+
+        updated = self.claimed(job).update(
+            status=status,
+            attempts=attempts,
+            run_at=run_at,
+            locked_at=None,
+            last_error=error,
+            updated_at=now,
+        )
+        if not updated:
+            self.lost(job)
+
+    def lost(self, job):
+        logger.warning(
+            "Job %s (%s) finished after its claim was requeued; result dropped",
+            job.pk,
+            job.name,
+        )
+
+    def requeue_stale(self):
+        """Put back jobs whose worker died, or that overran their timeout.
+
+        The lost run counts as an attempt, so a job that keeps killing its
+        worker ends up failed instead of being retried forever.
+        """
+        now = timezone.now()
+        stale = (
+            Job.objects.filter(status=Job.Status.RUNNING)
+            .alias(
+                deadline=F("locked_at")
+                + Coalesce("timeout", Value(self.lock_timeout, DurationField()))
+            )
+            .filter(deadline__lt=now)
+        )
+        lost = {
+            "attempts": F("attempts") + 1,
+            "locked_at": None,
+            "last_error": "Run did not finish within its timeout",
+            "updated_at": now,
+        }
+
+        with transaction.atomic():
+            stale.filter(attempts__gte=F("max_attempts") - 1).update(
+                status=Job.Status.FAILED, **lost
+            )
+            stale.update(status=Job.Status.QUEUED, **lost)
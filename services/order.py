@@ -0,0 +1,103 @@
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+from content.jobs import send_order_confirmation
+from content.models import Order, OrderItem, Product
+
+
+class Service:
+    @staticmethod
+    @transaction.atomic
+    def create_order(customer, items):
+        """Create an order for ``customer`` from ``(product, quantity)`` pairs."""
+        Service.reserve_stock(items)
+
+        order = Order(
+            customer=customer,
+            total_amount=sum(product.price * quantity for product, quantity in items),
+        )
+        order.save()
+
+        OrderItem.objects.bulk_create(
+            OrderItem(
+                order=order,
+                product=product,
+                quantity=quantity,
+                unit_price=product.price,
+                created_at=order.created_at,
+            )
+            for product, quantity in items
+        )
+
+        send_order_confirmation.enqueue(order_id=order.pk)
+
+        return order
+
+    @staticmethod
+    @transaction.atomic
+    def cancel_order(order):
+        """Cancel ``order`` and return its reserved stock; no-op if already canceled."""
+        canceled = (
+            Order.objects.filter(pk=order.pk)
+            .exclude(status=Order.Status.CANCELED)
+            .update(status=Order.Status.CANCELED, updated_at=timezone.now())
+        )
+
+        if canceled:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE {Product._meta.db_table}
+                    SET stock = {Product._meta.db_table}.stock + lines.quantity
+                    FROM (
+                        SELECT product_id, SUM(quantity) AS quantity
+                        FROM {OrderItem._meta.db_table}
+                        WHERE order_id = %s AND product_id IS NOT NULL
+                        GROUP BY product_id
+                    ) AS lines
+                    WHERE {Product._meta.db_table}.id = lines.product_id
+                    """,
+                    [order.pk],
+                )
+
+        order.status = Order.Status.CANCELED
+        if canceled:
+            order.publish_status()
+
+        return order
+
+    @staticmethod
+    def reserve_stock(items):
+        """Decrement stock for all lines in one conditional UPDATE.
+
+        Rows only change where enough stock is left, or where stock is not
+        tracked (NULL); any line missing from the returned ids is short, and
+        the raised ValidationError rolls back the surrounding transaction.
+        """
+        lines = sorted((product.pk, quantity) for product, quantity in items)
+        uuids = {product.pk: product.uuid for product, _ in items}
+        table = Product._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH lines (product_id, quantity) AS (
+                    VALUES {", ".join(["(%s, %s)"] * len(lines))}
+                )
+                UPDATE {table}
+                SET stock = {table}.stock - lines.quantity
+                FROM lines
+                WHERE {table}.id = lines.product_id
+                AND ({table}.stock IS NULL OR {table}.stock >= lines.quantity)
+                RETURNING {table}.id
+                """,
+                [value for line in lines for value in line],
+            )
+            reserved = {row[0] for row in cursor.fetchall()}
+
+        short = [str(uuids[pk]) for pk, _ in lines if pk not in reserved]
+        if short:
+            raise ValidationError(
+                f"Insufficient stock for products: {', '.join(short)}",
+                code="out_of_stock",
+            )
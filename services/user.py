@@ -1,16 +1,14 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from content.models import Company, Person
+from access.jobs import send_welcome_email
 
 
 class Service:
+    @staticmethod
     @transaction.atomic
     def create_user_with_profile(email, password, user_type, profile_data):
         from access.models import User
-
-        user = User.objects.create_user(
-            email=email, password=password, user_type=user_type
-        )
+        from content.models import Company, Person
 
         if user_type not in [User.UserType.COMPANY, User.UserType.PERSON]:
             raise ValidationError(f"Invalid user type: {user_type}")
@@ -28,3 +26,8 @@ class Service:
 
         except Exception as e:
             raise ValidationError(f"Failed to create user: {str(e)}")
+
+        # Sent by the job worker once the signup has committed.
+        send_welcome_email.enqueue(user_id=user.pk)
+
+        return user
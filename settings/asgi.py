@@ -13,4 +13,16 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up, as it loads models.
+from api.order.stream import OrderStatusStream  # noqa: E402
+
+order_status_stream = OrderStatusStream()
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"] == "/api/orders/stream/":
+        await order_status_stream(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
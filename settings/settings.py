@@ -1,5 +1,7 @@
+from datetime import timedelta
 from pathlib import Path
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 from settings.environment import ENV
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -30,10 +32,15 @@ INSTALLED_APPS = [
     "access.apps.AccessConfig",
     "content.apps.ContentConfig",
     "api.apps.ApiConfig",
+    "jobs.apps.JobsConfig",
+    "webhooks.apps.WebhooksConfig",
     "rest_framework",
 ]
 
 MIDDLEWARE = [
+    "common.middleware.MetricsMiddleware",
+    "common.middleware.CompressionMiddleware",
+    "common.middleware.IdentityMapMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -68,6 +75,24 @@ WSGI_APPLICATION = "settings.wsgi.application"
 
 DATABASES = {"default": dj_database_url.config()}
 
+# SQLite has no covering indexes; the uuid constraints (CoveringUniqueConstraint)
+# become plain unique indexes there, which this check does not know about.
+SILENCED_SYSTEM_CHECKS = ["models.W039"]
+
+
+# Cache
+# https://django-environ.readthedocs.io/en/latest/types.html#environ-env-cache-url
+
+CACHES = {"default": ENV.cache_url("CACHE_URL", default="locmemcache://")}
+
+# User.get_profile results, cached across requests only when set. Must be a
+# backend all workers share (Redis, Memcached, database), or a profile change
+# made in one worker leaves the others serving the old one.
+if "PROFILE_CACHE_URL" in ENV:
+    CACHES["profiles"] = ENV.cache_url("PROFILE_CACHE_URL")
+    if CACHES["profiles"]["BACKEND"].endswith("LocMemCache"):
+        raise ImproperlyConfigured("PROFILE_CACHE_URL must be shared by all workers")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -105,6 +130,49 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+
+# Idempotency keys
+# How long a stored response can be replayed for a repeated Idempotency-Key.
+
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+
+# Batch requests
+# Sub-requests allowed per /api/batch/ call, and threads used to run them
+# concurrently when the client asks for it under ASGI.
+
+BATCH_MAX_REQUESTS = ENV.int("BATCH_MAX_REQUESTS", default=20)
+BATCH_MAX_WORKERS = ENV.int("BATCH_MAX_WORKERS", default=4)
+
+
+# Order partitioning
+# Detached order partitions are dumped here by `partition_orders --retain`.
+# Order lists cover the last ORDER_LIST_DAYS unless the client passes
+# ?since=, so only the partitions in that window are read.
+
+ORDER_ARCHIVE_DIR = ENV.str(
+    "ORDER_ARCHIVE_DIR", default=str(BASE_DIR / "var" / "archive")
+)
+ORDER_LIST_DAYS = ENV.int("ORDER_LIST_DAYS", default=90)
+
+
+# Recommendations
+# Co-occurrence matrix kept between incremental `build_recommendations` runs.
+
+RECOMMENDATIONS_DIR = ENV.str(
+    "RECOMMENDATIONS_DIR", default=str(BASE_DIR / "var" / "recommendations")
+)
+
+
+# Response compression
+# Responses smaller than this many bytes are sent uncompressed.
+
+COMPRESSION_MIN_SIZE = 1024
+
+CATALOG_SNAPSHOT_DIR = ENV.str(
+    "CATALOG_SNAPSHOT_DIR", default=str(BASE_DIR / "var" / "catalog")
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -112,3 +180,34 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 AUTH_USER_MODEL = "access.User"
+
+
+# Django REST framework
+
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "api.authentication.JWTAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+
+# Metrics
+# Directory shared by all worker processes; leave unset for a single process.
+
+METRICS_DIR = ENV.str("METRICS_DIR", default=None)
+
+# /metrics answers scrapes with this bearer token, or from these addresses.
+# Addresses are matched against REMOTE_ADDR, which is the proxy's address
+# behind a reverse proxy, so only list them when clients connect directly.
+METRICS_ALLOWED_IPS = ENV.list("METRICS_ALLOWED_IPS", default=[])
+METRICS_TOKEN = ENV.str("METRICS_TOKEN", default=None)
@@ -0,0 +1,34 @@
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+
+from settings.settings import *  # noqa: E402,F401,F403
+from settings.settings import ENV  # noqa: E402
+
+
+# Database
+# SQLite in memory unless TEST_DATABASE_URL points at Postgres. With
+# `--parallel`, Django copies the migrated test database for each worker
+# (CREATE DATABASE ... TEMPLATE on Postgres), so migrations run only once.
+
+DATABASES = {
+    "default": ENV.db_url("TEST_DATABASE_URL", default="sqlite://:memory:")
+}
+
+
+# Cache
+# Per process is fine here: each test process runs on its own database.
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "profiles": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "profiles",
+    },
+}
+
+
+# Password hashing
+# A fast hasher; the production one is deliberately slow.
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import WebhookEndpoint
+
+
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    readonly_fields = ["id", "uuid", "created_at", "updated_at"]
+    list_display = ["url", "is_active", "max_concurrency", "batch_size"]
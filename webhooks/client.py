@@ -0,0 +1,176 @@
+import asyncio
+import ssl
+from urllib.parse import urlsplit
+
+
+# Statuses whose responses never carry a body (RFC 9112, section 6.3).
+NO_BODY_STATUSES = (204, 304)
+
+
+class HTTPError(Exception):
+    pass
+
+
+class ConnectionClosed(HTTPError):
+    """The server closed the connection before sending a status line."""
+
+
+class HTTPClient:
+    """Minimal asyncio HTTP/1.1 client that keeps connections alive per host.
+
+    Only what webhook delivery needs: send a request, read the status and
+    discard the response body, then return the connection to the pool
+    unless the server asked to close it. ``timeout`` bounds the whole
+    exchange, sending included. A request on a reused connection that the
+    server closed before answering is sent once more on a new connection.
+    """
+
+    def __init__(self, timeout=10.0, max_idle_per_host=8):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._ssl_context = ssl.create_default_context()
+
+    async def post(self, url, body, headers=None):
+        return await self.request("POST", url, body, headers)
+
+    async def request(self, method, url, body=b"", headers=None):
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        port = parts.port or (443 if secure else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        request = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        request += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        data = ("\r\n".join(request) + "\r\n\r\n").encode("latin-1") + body
+
+        reader, writer, reused = await self._acquire(
+            key, parts.hostname, port, secure
+        )
+        try:
+            status, keep_alive = await self._exchange(reader, writer, data, method)
+        except ConnectionClosed:
+            if not reused:
+                raise
+            # Closed while idle, as we picked it up; the request went unanswered.
+            reader, writer = await self._connect(parts.hostname, port, secure)
+            status, keep_alive = await self._exchange(reader, writer, data, method)
+
+        if keep_alive:
+            self._release(key, reader, writer)
+        else:
+            writer.close()
+
+        return status
+
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def _exchange(self, reader, writer, data, method):
+        try:
+            return await asyncio.wait_for(
+                self._send(reader, writer, data, method), self.timeout
+            )
+        except BaseException:
+            writer.close()
+            raise
+
+    async def _send(self, reader, writer, data, method):
+        try:
+            writer.write(data)
+            await writer.drain()
+        except (ConnectionResetError, BrokenPipeError) as error:
+            raise ConnectionClosed("Connection closed while sending") from error
+
+        return await self._read_response(reader, method)
+
+    async def _acquire(self, key, host, port, secure):
+        connections = self._idle.get(key, [])
+        while connections:
+            reader, writer = connections.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+
+        return *await self._connect(host, port, secure), False
+
+    async def _connect(self, host, port, secure):
+        return await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port, ssl=self._ssl_context if secure else None
+            ),
+            self.timeout,
+        )
+
+    def _release(self, key, reader, writer):
+        connections = self._idle.setdefault(key, [])
+        if len(connections) < self.max_idle_per_host:
+            connections.append((reader, writer))
+        else:
+            writer.close()
+
+    async def _read_response(self, reader, method):
+        version, status, headers = await self._read_head(reader)
+        # Skip interim responses such as 100 Continue or 103 Early Hints.
+        while 100 <= status < 200:
+            if status == 101:
+                raise HTTPError("Unexpected protocol switch")
+            version, status, headers = await self._read_head(reader)
+
+        if method == "HEAD" or status in NO_BODY_STATUSES:
+            # No body, whatever Content-Length or Transfer-Encoding say.
+            pass
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                await reader.readexactly(size + 2)
+            # Trailer fields, ended by an empty line.
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+        elif "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+        else:
+            # Body delimited by connection close.
+            await reader.read()
+            return status, False
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = (
+            connection == "keep-alive"
+            if version == "HTTP/1.0"
+            else connection != "close"
+        )
+        return status, keep_alive
+
+    async def _read_head(self, reader):
+        try:
+            status_line = await reader.readline()
+        except ConnectionResetError:
+            status_line = b""
+        if not status_line:
+            raise ConnectionClosed("Connection closed before the response")
+        try:
+            version, status = status_line.decode("latin-1").split()[:2]
+            status = int(status)
+        except ValueError:
+            raise HTTPError(f"Malformed status line: {status_line!r}")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return version, status, headers
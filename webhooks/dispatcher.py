@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .client import HTTPClient
+from .models import OutboxEvent, WebhookDelivery, WebhookEndpoint
+
+
+logger = logging.getLogger(__name__)
+
+
+class Dispatcher:
+    """Deliver outbox events to webhook endpoints in batches.
+
+    Each cycle fans new outbox events out into one delivery per active
+    endpoint, claims due deliveries, and POSTs them as JSON arrays of up to
+    ``endpoint.batch_size`` events. Requests to different endpoints run
+    concurrently; ``endpoint.max_concurrency`` caps requests in flight per
+    endpoint. Failed batches are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        claim_size=500,
+        poll_interval=1.0,
+        timeout=10.0,
+        max_attempts=8,
+        retry_delay=timedelta(seconds=30),
+        lock_timeout=timedelta(minutes=5),
+    ):
+        self.claim_size = claim_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lock_timeout = lock_timeout
+
+        self.client = HTTPClient(timeout=timeout)
+        self._semaphores = {}
+
+    async def run(self, once=False):
+        try:
+            while True:
+                await sync_to_async(self.fan_out)()
+                claimed = await sync_to_async(self.claim)()
+
+                await asyncio.gather(
+                    *(
+                        self.deliver(endpoint, batch)
+                        for endpoint, deliveries in claimed.items()
+                        for batch in _chunks(deliveries, endpoint.batch_size)
+                    )
+                )
+
+                if once:
+                    return
+                if not claimed:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            await self.client.close()
+
+    def fan_out(self):
+        with transaction.atomic():
+            events = list(
+                OutboxEvent.objects.select_for_update(skip_locked=True)
+                .filter(fanned_out_at__isnull=True)
+                .order_by("id")[: self.claim_size]
+            )
+            if not events:
+                return
+
+            now = timezone.now()
+            endpoints = list(WebhookEndpoint.objects.filter(is_active=True))
+
+            WebhookDelivery.objects.bulk_create(
+                WebhookDelivery(event=event, endpoint=endpoint, next_attempt_at=now)
+                for event in events
+                for endpoint in endpoints
+            )
+            OutboxEvent.objects.filter(pk__in=[event.pk for event in events]).update(
+                fanned_out_at=now
+            )
+
+    def claim(self):
+        """Lock due deliveries for this dispatcher, grouped by endpoint."""
+        now = timezone.now()
+
+        with transaction.atomic():
+            deliveries = list(
+                WebhookDelivery.objects.select_for_update(
+                    skip_locked=True, of=("self",)
+                )
+                .select_related("event", "endpoint")
+                .filter(
+                    status=WebhookDelivery.Status.PENDING,
+                    next_attempt_at__lte=now,
+                )
+                .exclude(locked_at__gt=now - self.lock_timeout)
+                .order_by("event_id")[: self.claim_size]
+            )
+            WebhookDelivery.objects.filter(
+                pk__in=[delivery.pk for delivery in deliveries]
+            ).update(locked_at=now)
+
+        # Model instances hash by primary key, so this groups per endpoint.
+        grouped = defaultdict(list)
+        for delivery in deliveries:
+            grouped[delivery.endpoint].append(delivery)
+
+        return grouped
+
+    async def deliver(self, endpoint, deliveries):
+        body = json.dumps(
+            [
+                {
+                    "id": str(delivery.event.uuid),
+                    "type": delivery.event.event_type,
+                    "created_at": delivery.event.created_at.isoformat(),
+                    "data": delivery.event.payload,
+                }
+                for delivery in deliveries
+            ]
+        ).encode()
+        signature = hmac.new(endpoint.secret.encode(), body, hashlib.sha256)
+        headers = {
+            "Content-Type": "application/json",
+            "X-Webhook-Signature": f"sha256={signature.hexdigest()}",
+        }
+
+        semaphore = self._semaphores.setdefault(
+            endpoint.pk, asyncio.Semaphore(endpoint.max_concurrency)
+        )
+        async with semaphore:
+            try:
+                status = await self.client.post(endpoint.url, body, headers)
+                error = None if 200 <= status < 300 else f"HTTP {status}"
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+
+        if error:
+            logger.warning("Webhook batch to %s failed: %s", endpoint.url, error)
+
+        await sync_to_async(self.record)(deliveries, error)
+
+    def record(self, deliveries, error):
+        now = timezone.now()
+        ids = [delivery.pk for delivery in deliveries]
+
+        if error is None:
+            WebhookDelivery.objects.filter(pk__in=ids).update(
+                status=WebhookDelivery.Status.DELIVERED,
+                attempts=F("attempts") + 1,
+                locked_at=None,
+                last_error="",
+                updated_at=now,
+            )
+            return
+
+        # Deliveries in a batch may have different attempt counts.
+        for delivery in deliveries:
+            attempts = delivery.attempts + 1
+            if attempts < self.max_attempts:
+                status = WebhookDelivery.Status.PENDING
+                next_attempt_at = now + self.retry_delay * 2 ** (attempts - 1)
+            else:
+                status = WebhookDelivery.Status.FAILED
+                next_attempt_at = delivery.next_attempt_at
+
+            WebhookDelivery.objects.filter(pk=delivery.pk).update(
+                status=status,
+                attempts=attempts,
+                next_attempt_at=next_attempt_at,
+                locked_at=None,
+                last_error=error,
+                updated_at=now,
+            )
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), max(size, 1)):
+        yield items[start : start + size]
@@ -0,0 +1,29 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from webhooks.dispatcher import Dispatcher
+
+
+class Command(BaseCommand):
+    help = "Deliver outbox events to the registered webhook endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when nothing is due.",
+        )
+        parser.add_argument(
+            "--timeout", type=float, default=10.0, help="Per-request timeout."
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Run a single cycle and exit."
+        )
+
+    def handle(self, *args, **options):
+        dispatcher = Dispatcher(
+            poll_interval=options["poll_interval"], timeout=options["timeout"]
+        )
+        asyncio.run(dispatcher.run(once=options["once"]))
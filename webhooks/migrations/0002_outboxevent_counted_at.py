@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webhooks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxevent',
+            name='counted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(condition=models.Q(('counted_at__isnull', True), ('event_type', 'order.status_changed')), fields=['id'], name='outbox_pending_count_idx'),
+        ),
+    ]
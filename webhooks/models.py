@@ -0,0 +1,81 @@
+from django.db import models
+
+from common.models import AbstractModel
+
+
+class WebhookEndpoint(AbstractModel):
+    url = models.URLField(max_length=500)
+    secret = models.CharField(
+        max_length=128, help_text="Key for the X-Webhook-Signature HMAC"
+    )
+    is_active = models.BooleanField(default=True)
+
+    max_concurrency = models.PositiveSmallIntegerField(
+        default=4, help_text="Requests in flight to this endpoint at once"
+    )
+    batch_size = models.PositiveSmallIntegerField(
+        default=50, help_text="Events sent per request"
+    )
+
+    def __str__(self):
+        return self.url
+
+
+class OutboxEvent(AbstractModel):
+    """Event written in the same transaction as the change it describes."""
+
+    event_type = models.CharField(max_length=64)
+    payload = models.JSONField()
+
+    # Set once a delivery row exists for every active endpoint.
+    fanned_out_at = models.DateTimeField(blank=True, null=True)
+    # Set once content.recommendations has counted the order status change.
+    counted_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(fanned_out_at__isnull=True),
+                name="outbox_pending_fan_out_idx",
+            ),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(
+                    counted_at__isnull=True, event_type="order.status_changed"
+                ),
+                name="outbox_pending_count_idx",
+            ),
+        ]
+
+
+class WebhookDelivery(AbstractModel):
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DELIVERED = "delivered", "Delivered"
+        FAILED = "failed", "Failed"
+
+    event = models.ForeignKey(
+        OutboxEvent, on_delete=models.CASCADE, related_name="deliveries"
+    )
+    endpoint = models.ForeignKey(
+        WebhookEndpoint, on_delete=models.CASCADE, related_name="deliveries"
+    )
+
+    status = models.CharField(
+        max_length=12, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name_plural = "Webhook deliveries"
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="delivery_pending_idx",
+            )
+        ]
@@ -0,0 +1,6 @@
+from .models import OutboxEvent
+
+
+def publish(event_type, payload):
+    """Record an event; call inside the transaction that makes the change."""
+    return OutboxEvent.objects.create(event_type=event_type, payload=payload)
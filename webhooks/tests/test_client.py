@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+from asgiref.sync import sync_to_async
+
+from common.testing.cases import TestCase
+from webhooks.client import ConnectionClosed, HTTPClient
+from webhooks.dispatcher import Dispatcher
+from webhooks.models import WebhookDelivery, WebhookEndpoint
+from webhooks.outbox import publish
+
+
+class StubServer:
+    """Local HTTP/1.1 stand-in answering each request with the next canned response.
+
+    A ``None`` response closes the connection without answering, as a server
+    does when its keep-alive timeout races the next request.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.connections = 0
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/hook"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while self.responses:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *lines = head.decode("latin-1").split("\r\n")
+                headers = dict(
+                    line.lower().split(": ", 1) for line in lines if ": " in line
+                )
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((request_line, headers, body))
+
+                response = self.responses.pop(0)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+
+class HTTPClientTests(TestCase):
+    async def send(self, responses, requests):
+        client = HTTPClient(timeout=2)
+        async with StubServer(*responses) as server:
+            try:
+                statuses = [
+                    await client.request(method, server.url, b"{}")
+                    for method in requests
+                ]
+            finally:
+                await client.close()
+        return statuses, server
+
+    async def test_content_length_and_chunked_bodies(self):
+        statuses, server = await self.send(
+            [
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok",
+                b"HTTP/1.1 202 Accepted\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\nX-Trailer: 1\r\n\r\n",
+                b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n",
+            ],
+            ["POST", "POST", "POST"],
+        )
+
+        self.assertEqual(statuses, [200, 202, 200])
+        self.assertEqual(server.connections, 1)
+
+    async def test_responses_without_body(self):
+        statuses, server = await self.send(
+            [
+                b"HTTP/1.1 204 No Content\r\n\r\n",
+                b"HTTP/1.1 304 Not Modified\r\nContent-Length: 10\r\n\r\n",
+                b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n",
+                b"HTTP/1.1 100 Continue\r\n\r\n"
+                b"HTTP/1.1 201 Created\r\nContent-Length: 0\r\n\r\n",
+            ],
+            ["POST", "POST", "HEAD", "POST"],
+        )
+
+        self.assertEqual(statuses, [204, 304, 200, 201])
+        self.assertEqual(server.connections, 1)
+
+    async def test_connection_close(self):
+        statuses, server = await self.send(
+            [
+                b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 0\r\n\r\n",
+                b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n",
+            ],
+            ["POST", "POST"],
+        )
+
+        self.assertEqual(statuses, [200, 200])
+        self.assertEqual(server.connections, 2)
+
+    async def test_retries_once_when_a_reused_connection_was_closed(self):
+        statuses, server = await self.send(
+            [
+                b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n",
+                None,
+                b"HTTP/1.1 201 Created\r\nContent-Length: 0\r\n\r\n",
+            ],
+            ["POST", "POST"],
+        )
+
+        self.assertEqual(statuses, [200, 201])
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(server.connections, 2)
+
+    async def test_new_connections_closed_unanswered_are_not_retried(self):
+        with self.assertRaises(ConnectionClosed):
+            await self.send([None, None], ["POST"])
+
+    async def test_timeout_covers_sending(self):
+        stop = asyncio.Event()
+
+        async def never_read(reader, writer):
+            await stop.wait()
+            writer.close()
+
+        server = await asyncio.start_server(never_read, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = HTTPClient(timeout=0.2)
+        try:
+            # Far more than the socket buffers take, so sending has to wait.
+            with self.assertRaises(TimeoutError):
+                await client.post(f"http://127.0.0.1:{port}/hook", b"x" * 2**26)
+        finally:
+            stop.set()
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+
+class DispatcherTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.endpoint = WebhookEndpoint.objects.create(
+            url="http://placeholder/", secret="secret", batch_size=2
+        )
+        for n in range(3):
+            publish("order.status_changed", {"n": n})
+
+    async def test_delivers_batches_over_one_connection(self):
+        async with StubServer(
+            b"HTTP/1.1 204 No Content\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n",
+        ) as server:
+            self.endpoint.url = server.url
+            self.endpoint.max_concurrency = 1
+            await sync_to_async(self.endpoint.save)()
+
+            await Dispatcher(timeout=2).run(once=True)
+
+        delivered = await WebhookDelivery.objects.filter(
+            status=WebhookDelivery.Status.DELIVERED
+        ).acount()
+        self.assertEqual(delivered, 3)
+        self.assertEqual(server.connections, 1)
+
+        events = []
+        for _, headers, body in server.requests:
+            signature = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+            self.assertEqual(headers["x-webhook-signature"], f"sha256={signature}")
+            events += json.loads(body)
+        self.assertEqual(sorted(event["data"]["n"] for event in events), [0, 1, 2])